@@ -7,21 +7,18 @@ This script shows:
 3. Price-based treatment effects (vs ordered_units-based defaults)
 """
 
-import copy
-from datetime import datetime
-from typing import Dict, List
-
 import numpy as np
+import pandas as pd
 
 from online_retail_simulator import enrich, load_job_results, register_enrichment_function, simulate
 
 
-def price_discount(metrics: List[Dict], **kwargs) -> List[Dict]:
+def price_discount(metrics: pd.DataFrame, **kwargs) -> pd.DataFrame:
     """
     Apply price discount to enriched products.
 
     Args:
-        metrics: List of metric record dictionaries
+        metrics: Metrics DataFrame
         **kwargs: Parameters including:
             - discount_percent: Percentage discount (default: 0.2 for 20% off)
             - enrichment_fraction: Fraction of products to enrich (default: 0.3)
@@ -29,7 +26,7 @@ def price_discount(metrics: List[Dict], **kwargs) -> List[Dict]:
             - seed: Random seed for product selection (default: 42)
 
     Returns:
-        List of modified metric dictionaries with price discount applied
+        Metrics DataFrame with price discount applied
     """
     discount_percent = kwargs.get("discount_percent", 0.2)
     enrichment_fraction = kwargs.get("enrichment_fraction", 0.3)
@@ -38,36 +35,29 @@ def price_discount(metrics: List[Dict], **kwargs) -> List[Dict]:
 
     rng = np.random.default_rng(seed)
 
+    df = metrics.copy()
+
     # Get unique products and select fraction for enrichment
-    unique_products = list(set(record["product_id"] for record in metrics))
+    unique_products = np.sort(df["product_id"].unique())
     n_enriched = int(len(unique_products) * enrichment_fraction)
-    enriched_product_ids = set(rng.choice(unique_products, size=n_enriched, replace=False))
-
-    # Apply discount to enriched products after start date
-    treated_metrics = []
-    start_date = datetime.strptime(enrichment_start, "%Y-%m-%d")
+    enriched_product_ids = rng.choice(unique_products, size=n_enriched, replace=False)
 
-    for record in metrics:
-        record_copy = copy.deepcopy(record)
-        record_date = datetime.strptime(record_copy["date"], "%Y-%m-%d")
+    # Apply discount to enriched products after start date in a single vectorized pass
+    dates = pd.to_datetime(df["date"], format="%Y-%m-%d")
+    mask = df["product_id"].isin(enriched_product_ids) & (dates >= pd.Timestamp(enrichment_start))
 
-        # Apply discount if product is enriched and date is after start
-        if record_copy["product_id"] in enriched_product_ids and record_date >= start_date:
-            unit_price = record_copy.get("unit_price", record_copy.get("price"))
-            discounted_price = unit_price * (1 - discount_percent)
+    unit_price = df["unit_price"] if "unit_price" in df.columns else df["price"]
+    discounted_price = unit_price * (1 - discount_percent)
 
-            # Update price fields
-            if "unit_price" in record_copy:
-                record_copy["unit_price"] = round(discounted_price, 2)
-            if "price" in record_copy:
-                record_copy["price"] = round(discounted_price, 2)
+    # Update price fields
+    for col in ["unit_price", "price"]:
+        if col in df.columns:
+            df[col] = np.where(mask, discounted_price.round(2), df[col])
 
-            # Recalculate revenue
-            record_copy["revenue"] = round(record_copy["ordered_units"] * discounted_price, 2)
+    # Recalculate revenue
+    df["revenue"] = np.where(mask, (df["ordered_units"] * discounted_price).round(2), df["revenue"])
 
-        treated_metrics.append(record_copy)
-
-    return treated_metrics
+    return df
 
 
 def main():
@@ -78,7 +68,7 @@ def main():
 
     # Step 1: Register custom function
     print("Step 1: Registering custom enrichment function...")
-    register_enrichment_function("price_discount", price_discount)
+    register_enrichment_function("price_discount", price_discount, accepts="dataframe")
     print("✓ Registered 'price_discount' function")
 
     # Step 2: Generate base simulation data
@@ -117,19 +107,13 @@ def main():
 
     print(f"\nOriginal total revenue: ${original_post['revenue'].sum():.2f}")
     print(f"Enriched total revenue: ${enriched_post['revenue'].sum():.2f}")
-    print(
-        f"Revenue change: {((enriched_post['revenue'].sum() / original_post['revenue'].sum()) - 1) * 100:+.1f}%"
-    )
+    print(f"Revenue change: {((enriched_post['revenue'].sum() / original_post['revenue'].sum()) - 1) * 100:+.1f}%")
 
     # Show average price change
     original_avg_price = (original_post["revenue"] / original_post["ordered_units"]).mean()
     enriched_avg_price = (enriched_post["revenue"] / enriched_post["ordered_units"]).mean()
-    print(
-        f"\nAverage unit price: ${original_avg_price:.2f} → ${enriched_avg_price:.2f}"
-    )
-    print(
-        f"Price change: {((enriched_avg_price / original_avg_price) - 1) * 100:+.1f}%"
-    )
+    print(f"\nAverage unit price: ${original_avg_price:.2f} → ${enriched_avg_price:.2f}")
+    print(f"Price change: {((enriched_avg_price / original_avg_price) - 1) * 100:+.1f}%")
 
     print(f"\n✓ Results saved to: {job_info.storage_path}/{job_info.job_id}/")
 
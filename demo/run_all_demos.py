@@ -4,9 +4,9 @@ Run all demo scripts in simulation and enrichment directories.
 Discovers and executes all run_*.py files. Hard failure on any error.
 """
 
-import glob
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
 def main():
@@ -37,17 +37,41 @@ def main():
 
     print(f"Found {len(demo_scripts)} demo scripts")
 
-    for script_dir, script_name, script_path in demo_scripts:
-        print(f"\nRunning {os.path.relpath(script_path)}...")
-        try:
-            # Execute the script in its own directory
-            subprocess.run([sys.executable, script_name], check=True, cwd=script_dir)
-            print(f"✓ {os.path.relpath(script_path)} completed successfully")
-        except subprocess.CalledProcessError as e:
-            print(
-                f"✗ {os.path.relpath(script_path)} failed with exit code {e.returncode}"
-            )
-            raise
+    # Demos are independent, so run them concurrently. Threads are sufficient
+    # since each demo runs in its own subprocess; output is captured per demo
+    # to keep it readable.
+    failed = []
+    with ThreadPoolExecutor(max_workers=len(demo_scripts)) as executor:
+        futures = {
+            executor.submit(
+                subprocess.run,
+                [sys.executable, script_name],
+                cwd=script_dir,
+                capture_output=True,
+                text=True,
+            ): script_path
+            for script_dir, script_name, script_path in demo_scripts
+        }
+        for future in as_completed(futures):
+            script_path = futures[future]
+            result = future.result()
+            print(f"\n--- {os.path.relpath(script_path)} ---")
+            print(result.stdout, end="")
+            if result.returncode == 0:
+                print(f"✓ {os.path.relpath(script_path)} completed successfully")
+            else:
+                print(result.stderr, end="", file=sys.stderr)
+                print(
+                    f"✗ {os.path.relpath(script_path)} failed with exit code {result.returncode}"
+                )
+                failed.append(script_path)
+
+    # Hard failure on any error, after all outputs have been shown
+    if failed:
+        raise RuntimeError(
+            f"{len(failed)} demo(s) failed: "
+            + ", ".join(os.path.relpath(path) for path in sorted(failed))
+        )
 
     print("\n" + "=" * 60)
     print("All demos completed successfully!")
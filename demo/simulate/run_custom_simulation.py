@@ -37,27 +37,27 @@ def generate_electronics_only(config: Dict) -> pd.DataFrame:
         "Smart Watches": (100, 600),
     }
 
-    categories = list(price_ranges.keys())
-    chars = list(string.ascii_uppercase + string.digits)
-
-    products = []
-    for i in range(num_products):
-        category = rng.choice(categories)
-        price_min, price_max = price_ranges[category]
-        price = round(rng.uniform(price_min, price_max), 2)
-
-        # Generate electronics-style product identifier
-        product_id = "E" + "".join(rng.choice(chars) for _ in range(9))
-
-        products.append(
-            {
-                "product_identifier": product_id,
-                "category": category,
-                "price": price,
-            }
-        )
-
-    return pd.DataFrame(products)
+    categories = np.array(list(price_ranges.keys()))
+    price_bounds = np.array(list(price_ranges.values()), dtype=float)
+    chars = np.array(list(string.ascii_uppercase + string.digits))
+
+    # Draw categories and prices for all products at once
+    category_idx = rng.integers(0, len(categories), num_products)
+    price_min, price_max = price_bounds[category_idx].T
+    prices = np.round(rng.uniform(price_min, price_max), 2)
+
+    # Generate electronics-style product identifiers: "E" + 9 random characters
+    id_chars = chars[rng.integers(0, len(chars), (num_products, 9))]
+    product_ids = np.char.add("E", id_chars.view("U9").ravel())
+
+    products = {
+        "product_identifier": product_ids,
+        "category": categories[category_idx],
+        "price": prices,
+    }
+
+    # Few distinct categories, so store them as categorical; prices stay float64 like the package's own
+    return pd.DataFrame(products).astype({"category": "category"})
 
 
 def main():
@@ -8,6 +8,8 @@ This script shows:
 4. Customer journey funnel metrics (impressions → visits → cart adds → orders)
 """
 
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 import yaml
 
@@ -65,32 +67,46 @@ def analyze_results(metrics_df, products_df, granularity, job_info):
     print(f"\n✓ Results saved to: {job_info.storage_path}/{job_info.job_id}/")
 
 
+def run_simulation(granularity):
+    """Generate simulation data for one granularity.
+
+    Runs in a worker process. Each granularity uses its own config and storage
+    path, so the runs are fully independent.
+
+    Args:
+        granularity: "daily" or "weekly"
+
+    Returns:
+        JobInfo of the generated simulation
+    """
+    # Load base config
+    config = yaml.safe_load(open("config_default_simulation.yaml"))
+
+    # Set granularity
+    config["RULE"]["METRICS"]["PARAMS"]["granularity"] = granularity
+
+    # Update storage path to separate daily and weekly outputs
+    config["STORAGE"]["PATH"] = f"output/sim_demo_{granularity}"
+
+    # Pass the modified config directly, no temporary file needed
+    return simulate(config)
+
+
 def main():
     granularities = ["daily", "weekly"]
 
+    # Granularities are independent, so generate them in parallel
+    print(f"Generating synthetic retail data ({', '.join(granularities)}) in parallel...")
+    with ProcessPoolExecutor(max_workers=len(granularities)) as executor:
+        job_infos = dict(zip(granularities, executor.map(run_simulation, granularities)))
+
     for granularity in granularities:
         print("\n" + "=" * 60)
         print(f"DEFAULT SIMULATION DEMO - {granularity.upper()} GRANULARITY")
         print("=" * 60)
         print(f"Using built-in rule-based generation with {granularity} aggregation\n")
 
-        # Load base config
-        config = yaml.safe_load(open("config_default_simulation.yaml"))
-
-        # Set granularity
-        config["RULE"]["METRICS"]["PARAMS"]["granularity"] = granularity
-
-        # Update storage path to separate daily and weekly outputs
-        config["STORAGE"]["PATH"] = f"output/sim_demo_{granularity}"
-
-        # Save temporary config
-        temp_config_path = f"/tmp/config_demo_{granularity}.yaml"
-        with open(temp_config_path, "w") as f:
-            yaml.dump(config, f)
-
-        # Generate simulation data
-        print(f"Generating synthetic retail data ({granularity})...")
-        job_info = simulate(temp_config_path)
+        job_info = job_infos[granularity]
         print(f"✓ Simulation completed. Job ID: {job_info}")
 
         # Load results for analysis
@@ -1,11 +1,24 @@
 """Configuration processing with defaults and validation."""
 
 import copy
+import functools
+import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple, Union
 
 from artifact_store import ArtifactStore
 
+from .core import json_io
+
+# Parameters that have a null default but must be set by the user
+_REQUIRED_NON_NULL_PARAMS = frozenset({"training_data_path"})
+
+# Sections validated per backend, as (section, whether FUNCTION must be given)
+_SECTION_RULES = {
+    "RULE": (("CHARACTERISTICS", False), ("METRICS", False)),
+    "SYNTHESIZER": (("CHARACTERISTICS", True), ("METRICS", True)),
+}
+
 
 def _extract_param_schemas_from_defaults() -> Dict[str, Any]:
     """Extract parameter schemas from config defaults."""
@@ -30,15 +43,20 @@ def _extract_param_schemas_from_defaults() -> Dict[str, Any]:
     return schemas
 
 
+@functools.lru_cache(maxsize=1)
 def _get_param_schemas() -> Dict[str, Any]:
-    """Get parameter schemas, cached for performance."""
-    if not hasattr(_get_param_schemas, "_cache"):
-        _get_param_schemas._cache = _extract_param_schemas_from_defaults()
-    return _get_param_schemas._cache
+    """Get parameter schemas, built once from the defaults and reused for every validation."""
+    return _extract_param_schemas_from_defaults()
 
 
+@functools.lru_cache(maxsize=1)
 def load_defaults() -> Dict[str, Any]:
-    """Load default configuration from package."""
+    """
+    Load default configuration from package.
+
+    The defaults ship with the package and are read once per process. The returned
+    dictionary is shared between callers and must not be modified in place.
+    """
     defaults_path = str(Path(__file__).parent / "config_defaults.yaml")
     store, filename = ArtifactStore.from_file_path(defaults_path)
     return store.read_yaml(filename)
@@ -56,13 +74,17 @@ def get_impact_defaults(function_name: str) -> Dict[str, Any]:
     """
     defaults = load_defaults()
     impact_defaults = defaults.get("IMPACT", {})
-    return copy.deepcopy(impact_defaults.get(function_name, {}))
+    # Impact parameters are flat scalars, a shallow copy keeps the shared defaults intact
+    return dict(impact_defaults.get(function_name, {}))
 
 
 def deep_merge(base: Dict, override: Dict) -> Dict:
     """
     Deep merge two dictionaries, with override values taking precedence.
 
+    The result is an independent copy; neither input is modified and mutating the
+    result does not affect them.
+
     Args:
         base: Base dictionary (defaults)
         override: Override dictionary (user config)
@@ -70,15 +92,32 @@ def deep_merge(base: Dict, override: Dict) -> Dict:
     Returns:
         Merged dictionary
     """
-    result = copy.deepcopy(base)
+    return _deep_merge_into(copy.deepcopy(base), override)
 
+
+def _deep_merge_into(base: Dict, override: Dict) -> Dict:
+    """
+    Deep merge override into base, with override values taking precedence.
+
+    Modifies base in place, including its nested dictionaries, so use only when base
+    is not reused afterwards, e.g. a fresh copy of the defaults. Values taken from
+    override are copied, so the result never shares state with it.
+
+    Args:
+        base: Base dictionary (defaults), modified in place
+        override: Override dictionary (user config)
+
+    Returns:
+        The merged base dictionary
+    """
     for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
+        existing = base.get(key)
+        if isinstance(existing, dict) and isinstance(value, dict):
+            _deep_merge_into(existing, value)
         else:
-            result[key] = copy.deepcopy(value)
+            base[key] = copy.deepcopy(value)
 
-    return result
+    return base
 
 
 def _require(config: Dict[str, Any], path: str, message: str) -> None:
@@ -131,12 +170,12 @@ def _validate_params(backend: str, section: str, function_name: str, params: Dic
         )
 
     # Check for null values that must be user-provided (only for specific params)
-    required_non_null_params = {"training_data_path"}  # Only these cannot be null
-    for param, value in params.items():
-        if value is None and param in required_non_null_params:
-            raise ValueError(
-                f"Parameter '{param}' for {backend}.{section}.{function_name} must be provided by user (cannot be null)"
-            )
+    null_params = sorted(param for param in _REQUIRED_NON_NULL_PARAMS & provided_params if params[param] is None)
+    if null_params:
+        raise ValueError(
+            f"Parameter '{null_params[0]}' for {backend}.{section}.{function_name} must be provided by user "
+            "(cannot be null)"
+        )
 
 
 def validate_config(config: Dict[str, Any]) -> None:
@@ -149,6 +188,9 @@ def validate_config(config: Dict[str, Any]) -> None:
             "STORAGE.PATH",
             "Configuration with STORAGE must include STORAGE.PATH",
         )
+        storage_format = config["STORAGE"].get("FORMAT", "csv")
+        if storage_format not in ("csv", "parquet"):
+            raise ValueError(f"STORAGE.FORMAT must be 'csv' or 'parquet', got '{storage_format}'")
 
     # Validate that exactly one of RULE or SYNTHESIZER is present
     has_rule = "RULE" in config
@@ -159,53 +201,57 @@ def validate_config(config: Dict[str, Any]) -> None:
     elif not has_rule and not has_synthesizer:
         raise ValueError("Config must contain either RULE or SYNTHESIZER block")
 
-    # Validate RULE backend
-    if has_rule:
-        rule_config = config["RULE"]
-
-        # Validate CHARACTERISTICS
-        if "CHARACTERISTICS" in rule_config:
-            char_config = rule_config["CHARACTERISTICS"]
-            function_name = char_config.get("FUNCTION", "default")
-            params = char_config.get("PARAMS", {})
-            _validate_params("RULE", "CHARACTERISTICS", function_name, params)
-
-        # Validate METRICS
-        if "METRICS" in rule_config:
-            metrics_config = rule_config["METRICS"]
-            function_name = metrics_config.get("FUNCTION", "default")
-            params = metrics_config.get("PARAMS", {})
-            _validate_params("RULE", "METRICS", function_name, params)
-
-    # Validate SYNTHESIZER backend
-    if has_synthesizer:
-        syn_config = config["SYNTHESIZER"]
-
-        # Validate CHARACTERISTICS
-        if "CHARACTERISTICS" in syn_config:
-            char_config = syn_config["CHARACTERISTICS"]
-            function_name = char_config.get("FUNCTION")
-            if not function_name:
-                raise ValueError("SYNTHESIZER.CHARACTERISTICS.FUNCTION is required")
-            params = char_config.get("PARAMS", {})
-            _validate_params("SYNTHESIZER", "CHARACTERISTICS", function_name, params)
-
-        # Validate METRICS
-        if "METRICS" in syn_config:
-            metrics_config = syn_config["METRICS"]
-            function_name = metrics_config.get("FUNCTION")
-            if not function_name:
-                raise ValueError("SYNTHESIZER.METRICS.FUNCTION is required")
-            params = metrics_config.get("PARAMS", {})
-            _validate_params("SYNTHESIZER", "METRICS", function_name, params)
-
-
-def process_config(config_path: str) -> Dict[str, Any]:
+    # Validate the sections of the selected backend
+    backend = "RULE" if has_rule else "SYNTHESIZER"
+    backend_config = config[backend]
+    for section, function_required in _SECTION_RULES[backend]:
+        section_config = backend_config.get(section)
+        if section_config is None:
+            continue
+
+        function_name = section_config.get("FUNCTION")
+        if not function_name:
+            if function_required:
+                raise ValueError(f"{backend}.{section}.FUNCTION is required")
+            function_name = "default"
+
+        params = section_config.get("PARAMS", {})
+        _validate_params(backend, section, function_name, params)
+
+
+def load_config(config: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Load a raw user configuration without merging defaults.
+
+    Args:
+        config: Path to user configuration file (YAML or JSON, local or S3),
+            or an already loaded configuration dictionary
+
+    Returns:
+        User configuration dictionary
+
+    Raises:
+        FileNotFoundError: If config file doesn't exist
+    """
+    if isinstance(config, dict):
+        return config
+
+    file_key = _local_file_key(config)
+    if file_key is not None:
+        return copy.deepcopy(_parse_user_config(*file_key))
+
+    return _read_config_file(config)
+
+
+def process_config(config: Union[str, Dict[str, Any]], shared: bool = False) -> Dict[str, Any]:
     """
     Load, merge with defaults, and validate configuration.
 
     Args:
-        config_path: Path to user configuration file (local or S3)
+        config: Path to user configuration file (local or S3), or an already
+            loaded configuration dictionary
+        shared: If True, a cached config is returned without copying it. Only for
+            read-only use; the result must not be mutated.
 
     Returns:
         Complete validated configuration
@@ -214,40 +260,71 @@ def process_config(config_path: str) -> Dict[str, Any]:
         FileNotFoundError: If config file doesn't exist
         ValueError: If configuration is invalid
     """
+    if isinstance(config, str):
+        file_key = _local_file_key(config)
+        if file_key is not None:
+            cached = _process_config_cached(*file_key)
+            return cached if shared else copy.deepcopy(cached)
+
+    return _merge_and_validate(load_config(config))
+
+
+def _local_file_key(config_path: str) -> Optional[Tuple[str, int, int]]:
+    """
+    Return the (absolute path, mtime, size) cache key of a local config file.
+
+    Repeated calls with the same unchanged file hit the caches below, so loading or
+    processing it again costs a single stat(). Remote paths (e.g. S3) cannot be
+    stat'ed, return None and are always read.
+    """
+    try:
+        stat = os.stat(config_path)
+    except OSError:
+        return None
+    return os.path.abspath(config_path), stat.st_mtime_ns, stat.st_size
+
+
+def _read_config_file(config_path: str) -> Dict[str, Any]:
+    """Read a user config file (YAML or JSON, local or S3)."""
     store, filename = ArtifactStore.from_file_path(config_path)
 
     if not store.exists(filename):
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    # Load user config - support both YAML and JSON for backward compatibility
+    # Support both YAML and JSON for backward compatibility
     if filename.lower().endswith((".yaml", ".yml")):
-        user_config = store.read_yaml(filename)
-    else:
-        user_config = store.read_json(filename)
+        return store.read_yaml(filename)
+    return json_io.loads(store.read_text(filename))
 
-    # Load defaults
-    defaults = load_defaults()
+
+@functools.lru_cache(maxsize=16)
+def _parse_user_config(config_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a local config file, cached by path, modification time and size. Must not be mutated."""
+    return _read_config_file(config_path)
+
+
+@functools.lru_cache(maxsize=32)
+def _process_config_cached(config_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Process a local config file, cached by path, modification time and size. Must not be mutated."""
+    return _merge_and_validate(_parse_user_config(config_path, mtime_ns, size))
+
+
+def _merge_and_validate(user_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge a user config over the defaults and validate the result."""
+    # Deep copy of the shared defaults, so the result never aliases them and can be mutated
+    defaults = copy.deepcopy(load_defaults())
 
     # Remove conflicting blocks from defaults based on user config
     # User config determines which backend to use
     if "SYNTHESIZER" in user_config:
         # User wants SYNTHESIZER, remove RULE from defaults
-        if "RULE" in defaults:
-            defaults = copy.deepcopy(defaults)
-            del defaults["RULE"]
-    elif "RULE" in user_config:
-        # User wants RULE, remove SYNTHESIZER from defaults
-        if "SYNTHESIZER" in defaults:
-            defaults = copy.deepcopy(defaults)
-            del defaults["SYNTHESIZER"]
+        defaults.pop("RULE", None)
     else:
-        # User didn't specify backend, default to RULE
-        if "SYNTHESIZER" in defaults:
-            defaults = copy.deepcopy(defaults)
-            del defaults["SYNTHESIZER"]
+        # User wants RULE or didn't specify a backend (defaults to RULE), remove SYNTHESIZER
+        defaults.pop("SYNTHESIZER", None)
 
-    # Merge user config over defaults
-    config = deep_merge(defaults, user_config)
+    # Merge user config over the defaults copy, which is not reused
+    config = _deep_merge_into(defaults, user_config)
 
     validate_config(config)
     return config
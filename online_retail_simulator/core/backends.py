@@ -5,12 +5,27 @@ Provides abstract base class and registry for simulation backends.
 Backends encapsulate the logic for generating products and metrics.
 """
 
+import functools
+import importlib
 from abc import ABC, abstractmethod
-from typing import Dict, Type
+from typing import Any, Dict, Type
 
 import pandas as pd
 
 
+@functools.lru_cache(maxsize=None)
+def _lazy_import(module_name: str, attribute: str) -> Any:
+    """
+    Import an attribute from a module relative to this package on first use.
+
+    Backends import their simulation modules lazily to avoid circular imports and to keep
+    optional dependencies (e.g. SDV) out of the import path; caching the lookup keeps
+    repeated simulate calls from re-entering the import system.
+    """
+    module = importlib.import_module(module_name, package=__package__)
+    return getattr(module, attribute)
+
+
 class SimulationBackend(ABC):
     """Abstract base for simulation backends."""
 
@@ -53,9 +68,11 @@ class BackendRegistry:
     @classmethod
     def detect_backend(cls, config: dict) -> SimulationBackend:
         """Detect and instantiate the appropriate backend from config."""
-        for key, backend_cls in cls._backends.items():
-            if key in config:
-                return backend_cls(config[key])
+        # Configs have only a handful of top-level keys, so scan those and look each up
+        for key, value in config.items():
+            backend_cls = cls._backends.get(key)
+            if backend_cls is not None:
+                return backend_cls(value)
         available = list(cls._backends.keys())
         raise ValueError(f"Config must contain one of: {available}")
 
@@ -69,7 +86,7 @@ class RuleBackend(SimulationBackend):
         return "RULE"
 
     def simulate_products(self) -> pd.DataFrame:
-        from ..simulate.rule_registry import get_simulation_function
+        get_simulation_function = _lazy_import("..simulate.rule_registry", "get_simulation_function")
 
         products_config = self.config["PRODUCTS"]
         function_name = products_config.get("FUNCTION")
@@ -77,7 +94,7 @@ class RuleBackend(SimulationBackend):
         return func({"RULE": self.config})
 
     def simulate_metrics(self, products: pd.DataFrame) -> pd.DataFrame:
-        from ..simulate.rule_registry import get_simulation_function
+        get_simulation_function = _lazy_import("..simulate.rule_registry", "get_simulation_function")
 
         metrics_config = self.config["METRICS"]
         function_name = metrics_config.get("FUNCTION")
@@ -94,8 +111,8 @@ class SynthesizerBackend(SimulationBackend):
         return "SYNTHESIZER"
 
     def simulate_products(self) -> pd.DataFrame:
-        from ..simulate.products_synthesizer_based import (
-            simulate_products_synthesizer_based,
+        simulate_products_synthesizer_based = _lazy_import(
+            "..simulate.products_synthesizer_based", "simulate_products_synthesizer_based"
         )
 
         return simulate_products_synthesizer_based({"SYNTHESIZER": self.config})
@@ -103,8 +120,8 @@ class SynthesizerBackend(SimulationBackend):
     def simulate_metrics(self, products: pd.DataFrame) -> pd.DataFrame:
         # TODO: Currently ignores products. Revisit when synthesizer
         # evolves to condition metrics generation on products.
-        from ..simulate.metrics_synthesizer_based import (
-            simulate_metrics_synthesizer_based,
+        simulate_metrics_synthesizer_based = _lazy_import(
+            "..simulate.metrics_synthesizer_based", "simulate_metrics_synthesizer_based"
         )
 
         return simulate_metrics_synthesizer_based(products, {"SYNTHESIZER": self.config})
@@ -0,0 +1,69 @@
+"""
+CSV reading helpers for job artifacts and training data.
+
+Uses the multithreaded pyarrow parser for local files when pyarrow is installed and falls
+back to pandas' own parser otherwise.
+"""
+
+import numpy as np
+import pandas as pd
+from pandas._libs.parsers import STR_NA_VALUES
+
+try:
+    import pyarrow
+    from pyarrow import csv as pyarrow_csv
+except ImportError:  # pyarrow is optional, pandas' own CSV parser is used without it
+    pyarrow = None
+
+# pandas parses integers beyond int64 as Python ints, pyarrow as doubles; such files are left to pandas
+_INT64_LIMIT = 2.0**63
+
+
+def read_csv(path: str) -> pd.DataFrame:
+    """
+    Read a CSV file into a DataFrame, matching pd.read_csv with default options.
+
+    Args:
+        path: Local file path or any location pd.read_csv accepts (e.g. S3 URLs)
+
+    Returns:
+        DataFrame with the file contents
+    """
+    if pyarrow is not None and "://" not in path:
+        try:
+            df = _read_csv_pyarrow(path)
+        except pyarrow.ArrowInvalid:
+            df = None  # e.g. a column whose type changes after the first block, let pandas infer it
+        if df is not None and not _has_int64_overflow(df):
+            return df
+    return pd.read_csv(path)
+
+
+def _read_csv_pyarrow(path: str) -> pd.DataFrame:
+    """
+    Read a local CSV file straight into columns with the pyarrow parser.
+
+    Columns pyarrow would parse as dates or timestamps are read as text, pandas' default
+    missing-value markers (e.g. "NA" or "None") become missing values and all-empty columns
+    are read as float64, so the result matches pandas' default reader.
+    """
+    with pyarrow_csv.open_csv(path) as reader:
+        schema = reader.schema
+    text_columns = {field.name: pyarrow.string() for field in schema if pyarrow.types.is_temporal(field.type)}
+    convert_options = pyarrow_csv.ConvertOptions(
+        column_types=text_columns, null_values=sorted(STR_NA_VALUES), strings_can_be_null=True
+    )
+    table = pyarrow_csv.read_csv(path, convert_options=convert_options)
+    for i, field in enumerate(table.schema):
+        if pyarrow.types.is_null(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pyarrow.float64()))
+    return table.to_pandas()
+
+
+def _has_int64_overflow(df: pd.DataFrame) -> bool:
+    """Whether a float column holds whole numbers beyond int64, which pandas would keep as integers."""
+    for column in df.columns[df.dtypes == np.float64]:
+        values = df[column].to_numpy()
+        if np.any((np.abs(values) >= _INT64_LIMIT) & (values == np.floor(values))):
+            return True
+    return False
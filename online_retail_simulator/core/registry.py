@@ -1,5 +1,6 @@
 """Generic function registry with signature validation and lazy default loading."""
 
+import functools
 import importlib
 import inspect
 from typing import Callable, Dict, List, Optional, Set
@@ -106,12 +107,7 @@ class FunctionRegistry:
         Raises:
             ImportError: If module cannot be imported
         """
-        # Try to import from online_retail_simulator package first
-        try:
-            module = importlib.import_module(f"online_retail_simulator.{module_name}")
-        except (ImportError, ModuleNotFoundError):
-            # Fall back to importing as standalone module
-            module = importlib.import_module(module_name)
+        module = _resolve_module(module_name)
 
         # Register all compatible functions
         for name in dir(module):
@@ -134,3 +130,18 @@ class FunctionRegistry:
                 except (ValueError, TypeError):
                     # Skip objects that don't have valid signatures
                     continue
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_module(module_name: str):
+    """
+    Import a module by name, trying the online_retail_simulator package first.
+
+    Cached because a failed package-relative import is not recorded in sys.modules
+    and would otherwise rescan the import path on every registration.
+    """
+    try:
+        return importlib.import_module(f"online_retail_simulator.{module_name}")
+    except (ImportError, ModuleNotFoundError):
+        # Fall back to importing as standalone module
+        return importlib.import_module(module_name)
@@ -2,26 +2,31 @@
 Enrich workflow: applies enrichment treatments to metrics data.
 """
 
-from ..config_processor import process_config
+from typing import Dict, Union
+
+from ..config_processor import load_config, process_config
 from ..manage import JobInfo, save_job_metadata
 from .enrichment import enrich as apply_enrichment
 
 
-def enrich(config_path: str, job_info: JobInfo) -> JobInfo:
+def enrich(config: Union[str, Dict], job_info: JobInfo) -> JobInfo:
     """
-    Apply enrichment to metrics data using a config file.
+    Apply enrichment to metrics data using a config file or dictionary.
 
     Saves enriched results to the same job directory.
 
     Args:
-        config_path: Path to enrichment config (YAML or JSON)
+        config: Path to enrichment config (YAML or JSON), or an already loaded
+            config dictionary such as {"IMPACT": {"FUNCTION": ..., "PARAMS": {...}}}
         job_info: JobInfo object to load metrics data from
 
     Returns:
         JobInfo: Same job, now also containing enriched.csv and optionally potential_outcomes.csv
     """
-    # Load config
-    config = process_config(config_path)
+    # Load config once and reuse it for enrichment and metadata
+    config_path = config if isinstance(config, str) else None
+    user_config = load_config(config)
+    processed_config = process_config(user_config)
 
     # Load metrics from job
     metrics_df = job_info.load_df("metrics")
@@ -35,7 +40,7 @@ def enrich(config_path: str, job_info: JobInfo) -> JobInfo:
 
     # Apply enrichment (pass job_info and products for product-aware functions)
     enriched_df, potential_outcomes_df = apply_enrichment(
-        config_path, metrics_df, job_info=job_info, products_df=products_df
+        user_config, metrics_df, job_info=job_info, products_df=products_df
     )
 
     # Save enriched to same job
@@ -46,6 +51,6 @@ def enrich(config_path: str, job_info: JobInfo) -> JobInfo:
         job_info.save_df("potential_outcomes", potential_outcomes_df)
 
     # Update metadata
-    save_job_metadata(job_info, config, config_path, is_enriched=True)
+    save_job_metadata(job_info, processed_config, config_path, is_enriched=True)
 
     return job_info
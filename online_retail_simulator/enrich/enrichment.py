@@ -3,12 +3,10 @@ Interface for applying enrichment treatments to metrics data.
 Dispatches to impact-based implementation based on config.
 """
 
-import copy
-from typing import Any, Callable, Dict, List, Tuple
+from typing import AbstractSet, Any, Callable, Dict, FrozenSet, List, Tuple, Union
 
 import numpy as np
 import pandas as pd
-from artifact_store import ArtifactStore
 
 
 def parse_impact_spec(impact_spec: Dict) -> Tuple[str, str, Dict[str, Any]]:
@@ -53,8 +51,8 @@ def assign_enrichment(products: List[Dict], fraction: float, seed: int = None) -
     """
     rng = np.random.default_rng(seed)
 
-    # Create copy to avoid modifying original
-    enriched_products = copy.deepcopy(products)
+    # Shallow copies suffice, product records only hold scalar values
+    enriched_products = [dict(p) for p in products]
 
     # Randomly select products for enrichment
     n_enriched = int(len(products) * fraction)
@@ -67,49 +65,122 @@ def assign_enrichment(products: List[Dict], fraction: float, seed: int = None) -
     return enriched_products
 
 
+def get_enriched_ids(enriched_products: List[Dict]) -> FrozenSet:
+    """
+    Collect the IDs of products flagged as enriched.
+
+    Compute this once and pass it to apply_enrichment_to_metrics when applying several
+    effects to the same assignment.
+
+    Args:
+        enriched_products: List of products with 'enriched' field
+
+    Returns:
+        Frozen set of enriched product IDs
+    """
+    return frozenset(p["product_id"] for p in enriched_products if p.get("enriched", False))
+
+
 def apply_enrichment_to_metrics(
-    metrics: List[Dict],
-    enriched_products: List[Dict],
+    metrics: Union[List[Dict], pd.DataFrame],
+    enriched_products: Union[List[Dict], AbstractSet],
     enrichment_start: str,
     effect_function: Callable,
+    accepts: str = "records",
     **kwargs,
-) -> List[Dict]:
+) -> Union[List[Dict], pd.DataFrame]:
     """
     Apply enrichment treatment effect to metrics data.
 
     Args:
-        metrics: List of metric record dictionaries
-        enriched_products: List of products with 'enriched' field
+        metrics: List of metric record dictionaries or metrics DataFrame
+        enriched_products: List of products with 'enriched' field, or the precomputed
+            set of enriched product IDs from get_enriched_ids
         enrichment_start: Start date of enrichment (YYYY-MM-DD)
         effect_function: Treatment effect function to apply
+        accepts: "records" to call effect_function once per metric record of an
+            enriched product, "dataframe" to call it once with a DataFrame of all
+            those records
         **kwargs: Additional parameters to pass to effect function
 
     Returns:
-        List of modified metrics with treatment effect applied
+        Modified metrics with treatment effect applied, same type as the input
     """
-    # Create lookup for enriched products
-    enriched_ids = {p["product_id"] for p in enriched_products if p.get("enriched", False)}
+    if accepts not in ("records", "dataframe"):
+        raise ValueError(f"accepts must be one of ['records', 'dataframe'], got '{accepts}'")
 
-    # Apply effect to metrics of enriched products
+    # Create lookup for enriched products unless it was precomputed
+    if isinstance(enriched_products, AbstractSet):
+        enriched_ids = enriched_products
+    else:
+        enriched_ids = get_enriched_ids(enriched_products)
+
+    if accepts == "dataframe":
+        return _apply_enrichment_to_metrics_frame(metrics, enriched_ids, enrichment_start, effect_function, **kwargs)
+
+    if isinstance(metrics, pd.DataFrame):
+        # Only rows of enriched products are converted to records (fresh dicts) and back
+        df = metrics.reset_index(drop=True)
+        mask = df["product_id"].isin(enriched_ids)
+        treated_records = [
+            effect_function(record, enrichment_start=enrichment_start, **kwargs)
+            for record in df.loc[mask].to_dict("records")
+        ]
+        if not treated_records:
+            return metrics.copy()
+        treated = pd.DataFrame(treated_records, index=df.index[mask])
+        # Put treated rows back in their original positions, under the caller's index
+        result = pd.concat([df.loc[~mask], treated]).sort_index(kind="stable")
+        result.index = metrics.index
+        return result
+
+    # Apply effect to metrics of enriched products, untreated records are passed through as-is
     treated_metrics = []
     for record in metrics:
-        record_copy = copy.deepcopy(record)
+        if record["product_id"] in enriched_ids:
+            # Effect functions may modify the record in place, so hand them a (flat) copy
+            # and apply treatment effect function with all params as kwargs
+            record = effect_function(dict(record), enrichment_start=enrichment_start, **kwargs)
 
-        if record_copy["product_id"] in enriched_ids:
-            # Apply treatment effect function with all params as kwargs
-            record_copy = effect_function(record_copy, enrichment_start=enrichment_start, **kwargs)
-
-        treated_metrics.append(record_copy)
+        treated_metrics.append(record)
 
     return treated_metrics
 
 
-def enrich(config_path: str, df: pd.DataFrame, job_info=None, products_df=None) -> tuple:
+def _apply_enrichment_to_metrics_frame(
+    metrics: Union[List[Dict], pd.DataFrame],
+    enriched_ids: AbstractSet,
+    enrichment_start: str,
+    effect_function: Callable,
+    **kwargs,
+) -> Union[List[Dict], pd.DataFrame]:
+    """Apply a DataFrame effect function to all enriched metric rows in a single call."""
+    as_frame = isinstance(metrics, pd.DataFrame)
+    if not as_frame and len(metrics) == 0:
+        # An empty record list has no columns; empty frames still go through the effect
+        # function so the output columns do not depend on whether there are rows
+        return []
+
+    df = metrics.reset_index(drop=True) if as_frame else pd.DataFrame(metrics)
+
+    mask = df["product_id"].isin(enriched_ids)
+    treated = effect_function(df.loc[mask].copy(), enrichment_start=enrichment_start, **kwargs)
+
+    # Put treated rows back in their original positions
+    result = pd.concat([df.loc[~mask], treated]).sort_index(kind="stable")
+    if as_frame:
+        result.index = metrics.index
+        return result
+    return result.to_dict("records")
+
+
+def enrich(config: Union[str, Dict], df: pd.DataFrame, job_info=None, products_df=None) -> tuple:
     """
-    Apply enrichment to a DataFrame using a config file.
+    Apply enrichment to a DataFrame using a config file or dictionary.
 
     Args:
-        config_path: Path to enrichment config (YAML or JSON, local or S3)
+        config: Path to enrichment config (YAML or JSON, local or S3), or an
+            already loaded config dictionary
         df: DataFrame with metrics data (must include product_identifier)
         job_info: Optional JobInfo for product-aware enrichment functions
         products_df: Optional products DataFrame for product-aware enrichment functions
@@ -119,12 +190,10 @@ def enrich(config_path: str, df: pd.DataFrame, job_info=None, products_df=None)
             - enriched_df: DataFrame with enrichment applied (factual version)
             - potential_outcomes_df: DataFrame with Y0/Y1 for all products, or None if not provided
     """
-    # Load config using ArtifactStore - support both YAML and JSON
-    store, filename = ArtifactStore.from_file_path(config_path)
-    if filename.lower().endswith((".yaml", ".yml")):
-        config = store.read_yaml(filename)
-    else:
-        config = store.read_json(filename)
+    from ..config_processor import get_impact_defaults, load_config
+    from .enrichment_registry import accepts_dataframe, load_effect_function
+
+    config = load_config(config)
 
     # Get impact specification from config
     impact_spec = config.get("IMPACT")
@@ -134,9 +203,6 @@ def enrich(config_path: str, df: pd.DataFrame, job_info=None, products_df=None)
     # Parse impact function
     module_name, function_name, user_params = parse_impact_spec(impact_spec)
 
-    from ..config_processor import get_impact_defaults
-    from .enrichment_registry import load_effect_function
-
     # Merge user params over centralized defaults
     default_params = get_impact_defaults(function_name)
     all_params = {**default_params, **user_params}
@@ -147,37 +213,40 @@ def enrich(config_path: str, df: pd.DataFrame, job_info=None, products_df=None)
     if "product_identifier" not in df.columns:
         raise ValueError("Input DataFrame must contain 'product_identifier' column")
 
-    # Convert DataFrame to list of dicts for metrics, mapping product_identifier to product_id
-    metrics = df.to_dict(orient="records")
-    for record in metrics:
-        record["product_id"] = record["product_identifier"]  # Map product_identifier to product_id for enrichment
-        if "price" in record and "unit_price" not in record:
-            record["unit_price"] = record["price"]  # Ensure unit_price exists
-
     # Convert products to list of dicts if provided
     products = products_df.to_dict(orient="records") if products_df is not None else None
 
+    if accepts_dataframe(function_name):
+        # Map product_identifier to product_id for enrichment and ensure unit_price exists
+        metrics = df.copy()
+        metrics["product_id"] = metrics["product_identifier"]
+        if "price" in metrics.columns and "unit_price" not in metrics.columns:
+            metrics["unit_price"] = metrics["price"]
+    else:
+        # Legacy record-based functions receive a list of dicts
+        metrics = df.to_dict(orient="records")
+        for record in metrics:
+            record["product_id"] = record["product_identifier"]  # Map product_identifier to product_id
+            if "price" in record and "unit_price" not in record:
+                record["unit_price"] = record["price"]  # Ensure unit_price exists
+
     # Apply impact function with all parameters - let the function handle everything
     # Pass job_info and products for product-aware enrichment functions
     result = impact_function(metrics, job_info=job_info, products=products, **all_params)
 
-    # Handle both return types: tuple (with potential outcomes) or list (without)
+    # Handle both return types: tuple (with potential outcomes) or metrics only (without)
     if isinstance(result, tuple):
         treated_metrics, potential_outcomes_df = result
     else:
         treated_metrics = result
         potential_outcomes_df = None
 
-    # Convert back to DataFrame and clean up
-    for record in treated_metrics:
-        record.pop("product_id", None)  # Remove temporary product_id mapping
-        (record.pop("unit_price", None) if "price" in record else None)  # Remove duplicate price field
-
-    enriched_df = pd.DataFrame(treated_metrics)
-
-    # Preserve original column order
-    original_cols = [col for col in df.columns if col in enriched_df.columns]
-    new_cols = [col for col in enriched_df.columns if col not in df.columns]
+    # Convert back to DataFrame, then drop the temporary product_id mapping and the duplicate
+    # unit_price while restoring the original column order in a single selection
+    enriched_df = treated_metrics if isinstance(treated_metrics, pd.DataFrame) else pd.DataFrame(treated_metrics)
+    drop_cols = {"product_id", "unit_price"} if "price" in enriched_df.columns else {"product_id"}
+    original_cols = [col for col in df.columns if col in enriched_df.columns and col not in drop_cols]
+    new_cols = [col for col in enriched_df.columns if col not in df.columns and col not in drop_cols]
     enriched_df = enriched_df[original_cols + new_cols]
 
     return enriched_df, potential_outcomes_df
@@ -1,28 +1,33 @@
 """Library of predefined treatment effect functions for catalog enrichment."""
 
-import copy
-from datetime import datetime
+from datetime import date
+from typing import Union
 
 import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional, the numpy implementation is used without it
+    njit = None
 
-def quantity_boost(metrics: list, **kwargs) -> tuple:
+
+def quantity_boost(metrics, **kwargs) -> tuple:
     """
     Boost ordered units by a percentage for enriched products.
 
     Args:
-        metrics: List of metric record dictionaries
+        metrics: Metrics DataFrame or list of metric record dictionaries
         **kwargs: Parameters including:
             - effect_size: Percentage increase in ordered units (default: 0.5 for 50% boost)
             - enrichment_fraction: Fraction of products to enrich (default: 0.3)
-            - enrichment_start: Start date of enrichment (default: "2024-11-15")
+            - enrichment_start: Start date of enrichment, "YYYY-MM-DD" string or date (default: "2024-11-15")
             - seed: Random seed for product selection (default: 42)
             - min_units: Minimum units for enriched products with zero sales (default: 1)
 
     Returns:
         Tuple of (treated_metrics, potential_outcomes_df):
-            - treated_metrics: List of modified metric dictionaries with treatment applied
+            - treated_metrics: Modified metrics with treatment applied, same type as the input
             - potential_outcomes_df: DataFrame with Y0_revenue and Y1_revenue for all products
     """
     effect_size = kwargs.get("effect_size", 0.5)
@@ -33,70 +38,26 @@ def quantity_boost(metrics: list, **kwargs) -> tuple:
 
     rng = np.random.default_rng(seed)
 
-    unique_products = list(set(record["product_id"] for record in metrics))
+    # Sort before sampling so the selection does not depend on set iteration order
+    unique_products = _sorted_product_ids(metrics)
     n_enriched = int(len(unique_products) * enrichment_fraction)
     enriched_product_ids = set(rng.choice(unique_products, size=n_enriched, replace=False))
 
-    treated_metrics = []
-    potential_outcomes = {}  # {(product_id, date): {'Y0_revenue': x, 'Y1_revenue': y}}
-    start_date = datetime.strptime(enrichment_start, "%Y-%m-%d")
-
-    for record in metrics:
-        record_copy = copy.deepcopy(record)
-        product_id = record_copy["product_id"]
-        record_date_str = record_copy["date"]
-        record_date = datetime.strptime(record_date_str, "%Y-%m-%d")
-
-        is_enriched = product_id in enriched_product_ids
-        record_copy["enriched"] = is_enriched
-
-        # Calculate Y(0) - baseline revenue (no treatment)
-        y0_revenue = record_copy["revenue"]
-
-        # Calculate Y(1) - revenue if treated (for ALL products)
-        unit_price = record_copy.get("unit_price", record_copy.get("price"))
-        if record_date >= start_date:
-            original_quantity = record_copy["ordered_units"]
-            boosted_quantity = int(original_quantity * (1 + effect_size))
-            boosted_quantity = max(min_units, boosted_quantity)
-            y1_revenue = round(boosted_quantity * unit_price, 2)
-        else:
-            # Before treatment start, Y(1) = Y(0)
-            y1_revenue = y0_revenue
-
-        # Store potential outcomes for ALL products
-        key = (product_id, record_date_str)
-        potential_outcomes[key] = {"Y0_revenue": y0_revenue, "Y1_revenue": y1_revenue}
-
-        # Apply factual outcome (only for treated products)
-        if is_enriched and record_date >= start_date:
-            record_copy["ordered_units"] = boosted_quantity
-            record_copy["revenue"] = y1_revenue
-
-        treated_metrics.append(record_copy)
-
-    # Build potential outcomes DataFrame
-    potential_outcomes_df = pd.DataFrame(
-        [
-            {
-                "product_identifier": pid,
-                "date": d,
-                "Y0_revenue": v["Y0_revenue"],
-                "Y1_revenue": v["Y1_revenue"],
-            }
-            for (pid, d), v in potential_outcomes.items()
-        ]
+    return _apply_quantity_boost(
+        metrics,
+        enriched_product_ids,
+        enrichment_start,
+        effect_size,
+        min_units=min_units,
     )
 
-    return treated_metrics, potential_outcomes_df
-
 
-def probability_boost(metrics: list, **kwargs) -> tuple:
+def probability_boost(metrics, **kwargs) -> tuple:
     """
     Boost sale probability (simulated by ordered units increase as proxy).
 
     Args:
-        metrics: List of metric record dictionaries
+        metrics: Metrics DataFrame or list of metric record dictionaries
         **kwargs: Same parameters as quantity_boost
 
     Returns:
@@ -105,7 +66,7 @@ def probability_boost(metrics: list, **kwargs) -> tuple:
     return quantity_boost(metrics, **kwargs)
 
 
-def product_detail_boost(metrics: list, **kwargs) -> tuple:
+def product_detail_boost(metrics, **kwargs) -> tuple:
     """
     Product detail regeneration and metrics boost for enrichment experiments.
 
@@ -114,21 +75,21 @@ def product_detail_boost(metrics: list, **kwargs) -> tuple:
     and applies metrics boost effect.
 
     Args:
-        metrics: List of metric record dictionaries
+        metrics: Metrics DataFrame or list of metric record dictionaries
         **kwargs: Parameters including:
             - job_info: JobInfo for saving product artifacts (required for saving)
             - products: List of product dictionaries (required for product details)
             - effect_size: Percentage increase in ordered units (default: 0.5)
             - ramp_days: Number of days for ramp-up period (default: 7)
             - enrichment_fraction: Fraction of products to enrich (default: 0.3)
-            - enrichment_start: Start date of enrichment (default: "2024-11-15")
+            - enrichment_start: Start date of enrichment, "YYYY-MM-DD" string or date (default: "2024-11-15")
             - seed: Random seed for product selection (default: 42)
             - prompt_path: Path to custom prompt template file (optional)
             - backend: Backend to use for regeneration ("mock" or "ollama", default: "mock")
 
     Returns:
         Tuple of (treated_metrics, potential_outcomes_df):
-            - treated_metrics: List of modified metric dictionaries with treatment applied
+            - treated_metrics: Modified metrics with treatment applied, same type as the input
             - potential_outcomes_df: DataFrame with Y0_revenue and Y1_revenue for all products
     """
     job_info = kwargs.get("job_info")
@@ -148,11 +109,11 @@ def product_detail_boost(metrics: list, **kwargs) -> tuple:
     if job_info and products:
         job_info.save_df("product_details_original", pd.DataFrame(products))
 
-    # 2. Select treatment products
+    # 2. Select treatment products (sorted so the selection is reproducible across processes)
     if products:
-        unique_product_ids = list(set(p.get("product_identifier", p.get("product_id")) for p in products))
+        unique_product_ids = sorted(set(p.get("product_identifier", p.get("product_id")) for p in products))
     else:
-        unique_product_ids = list(set(record["product_id"] for record in metrics))
+        unique_product_ids = _sorted_product_ids(metrics)
 
     n_treatment = int(len(unique_product_ids) * enrichment_fraction)
     treatment_ids = set(rng.choice(unique_product_ids, size=n_treatment, replace=False))
@@ -165,61 +126,126 @@ def product_detail_boost(metrics: list, **kwargs) -> tuple:
         job_info.save_df("product_details_enriched", pd.DataFrame(updated_products))
 
     # 4. Apply metrics boost effect and calculate potential outcomes
-    treated_metrics = []
-    potential_outcomes = {}  # {(product_id, date): {'Y0_revenue': x, 'Y1_revenue': y}}
-    start_date = datetime.strptime(enrichment_start, "%Y-%m-%d")
-
-    for record in metrics:
-        record_copy = copy.deepcopy(record)
-        product_id = record_copy.get("product_id", record_copy.get("product_identifier"))
-        record_date_str = record_copy["date"]
-        record_date = datetime.strptime(record_date_str, "%Y-%m-%d")
-
-        is_enriched = product_id in treatment_ids
-        record_copy["enriched"] = is_enriched
-
-        # Calculate Y(0) - baseline revenue (no treatment)
-        y0_revenue = record_copy["revenue"]
-
-        # Calculate Y(1) - revenue if treated (for ALL products, with ramp-up)
-        unit_price = record_copy.get("unit_price", record_copy.get("price"))
-        if record_date >= start_date:
-            days_since_start = (record_date - start_date).days
-            ramp_factor = 1.0 if ramp_days <= 0 else min(1.0, days_since_start / ramp_days)
-            adjusted_effect = effect_size * ramp_factor
-
-            original_quantity = record_copy["ordered_units"]
-            boosted_quantity = int(original_quantity * (1 + adjusted_effect))
-            y1_revenue = round(boosted_quantity * unit_price, 2)
-        else:
-            # Before treatment start, Y(1) = Y(0)
-            y1_revenue = y0_revenue
+    return _apply_quantity_boost(
+        metrics,
+        treatment_ids,
+        enrichment_start,
+        effect_size,
+        ramp_days=ramp_days,
+    )
 
-        # Store potential outcomes for ALL products
-        key = (product_id, record_date_str)
-        potential_outcomes[key] = {"Y0_revenue": y0_revenue, "Y1_revenue": y1_revenue}
 
-        # Apply factual outcome (only for treated products)
-        if is_enriched and record_date >= start_date:
-            record_copy["ordered_units"] = boosted_quantity
-            record_copy["revenue"] = y1_revenue
+def _sorted_product_ids(metrics) -> list:
+    """Return the sorted unique product IDs of a metrics DataFrame or list of records."""
+    if isinstance(metrics, pd.DataFrame):
+        return sorted(metrics["product_id"].unique())
+    return sorted(set(record["product_id"] for record in metrics))
 
-        treated_metrics.append(record_copy)
 
-    # Build potential outcomes DataFrame
-    potential_outcomes_df = pd.DataFrame(
-        [
-            {
-                "product_identifier": pid,
-                "date": d,
-                "Y0_revenue": v["Y0_revenue"],
-                "Y1_revenue": v["Y1_revenue"],
-            }
-            for (pid, d), v in potential_outcomes.items()
-        ]
+def _apply_quantity_boost(
+    metrics,
+    treatment_ids: set,
+    enrichment_start: Union[str, date],
+    effect_size: float,
+    ramp_days: int = 0,
+    min_units: int = 0,
+) -> tuple:
+    """
+    Apply an ordered units boost and compute potential outcomes in a single vectorized pass.
+
+    Y(1) is computed for ALL products from the enrichment start onwards (Y(1) = Y(0) before),
+    while the factual outcome is only changed for treated products.
+
+    Args:
+        metrics: Metrics DataFrame or list of metric record dictionaries
+        treatment_ids: Set of product IDs receiving the treatment
+        enrichment_start: Start date of enrichment, "YYYY-MM-DD" string or date
+        effect_size: Percentage increase in ordered units at full effect
+        ramp_days: Number of days to reach full effect (0 = immediate)
+        min_units: Minimum boosted units from the enrichment start onwards
+
+    Returns:
+        Tuple of (treated_metrics, potential_outcomes_df), treated_metrics having the input type
+    """
+    as_frame = isinstance(metrics, pd.DataFrame)
+    if len(metrics) == 0:
+        empty_outcomes = pd.DataFrame(columns=["product_identifier", "date", "Y0_revenue", "Y1_revenue"])
+        return (metrics.copy() if as_frame else []), empty_outcomes
+
+    df = metrics.copy() if as_frame else pd.DataFrame(metrics)
+    product_ids = df["product_id"] if "product_id" in df.columns else df["product_identifier"]
+    if "unit_price" in df.columns:
+        unit_price = df["unit_price"].fillna(df["price"]) if "price" in df.columns else df["unit_price"]
+    else:
+        unit_price = df["price"]
+
+    # Days since enrichment start, negative before the start. Metrics repeat the same few dates
+    # for every product, so only the unique date strings are parsed and the integer offsets
+    # are broadcast back to the rows.
+    date_codes, unique_dates = pd.factorize(df["date"], sort=False)
+    unique_days = (pd.to_datetime(unique_dates, format="%Y-%m-%d") - pd.Timestamp(enrichment_start)).days
+    days_since_start = unique_days.to_numpy(dtype=np.int64)[date_codes]
+    post_start = days_since_start >= 0
+
+    # Calculate Y(0) - baseline revenue, and Y(1) - revenue if treated (for ALL products)
+    y0_revenue = df["revenue"].to_numpy(dtype=np.float64)
+    boosted_quantity, y1_revenue = _boost_outcomes(
+        df["ordered_units"].to_numpy(dtype=np.float64),
+        unit_price.to_numpy(dtype=np.float64),
+        y0_revenue,
+        days_since_start,
+        float(effect_size),
+        int(ramp_days),
+        int(min_units),
     )
 
-    return treated_metrics, potential_outcomes_df
+    # Apply factual outcome (only for treated products)
+    is_enriched = product_ids.isin(treatment_ids).to_numpy()
+    treated = is_enriched & post_start
+    df["enriched"] = is_enriched
+    df["ordered_units"] = np.where(treated, boosted_quantity, df["ordered_units"].to_numpy())
+    df["revenue"] = np.where(treated, y1_revenue, y0_revenue)
+
+    # Potential outcomes for ALL products, one row per (product, date)
+    potential_outcomes_df = pd.DataFrame(
+        {
+            "product_identifier": product_ids.to_numpy(),
+            "date": df["date"].to_numpy(),
+            "Y0_revenue": y0_revenue,
+            "Y1_revenue": y1_revenue,
+        }
+    ).drop_duplicates(subset=["product_identifier", "date"], keep="last", ignore_index=True)
+
+    return (df if as_frame else df.to_dict("records")), potential_outcomes_df
+
+
+def _boost_outcomes_loop(ordered_units, unit_price, y0_revenue, days_since_start, effect_size, ramp_days, min_units):
+    """
+    Boosted ordered units and Y(1) revenue per record (explicit loop, compiled with numba when available).
+
+    Y(1) equals Y(0) for records before the enrichment start (negative days_since_start).
+    """
+    boosted_quantity = np.empty(ordered_units.size, dtype=np.int64)
+    y1_revenue = y0_revenue.copy()
+    for i in range(ordered_units.size):
+        ramp_factor = 1.0
+        if ramp_days > 0:
+            ramp_factor = min(1.0, days_since_start[i] / ramp_days)
+        boosted_quantity[i] = max(min_units, int(ordered_units[i] * (1 + effect_size * ramp_factor)))
+        if days_since_start[i] >= 0:
+            y1_revenue[i] = np.round(boosted_quantity[i] * unit_price[i], 2)
+    return boosted_quantity, y1_revenue
+
+
+def _boost_outcomes_numpy(ordered_units, unit_price, y0_revenue, days_since_start, effect_size, ramp_days, min_units):
+    """Vectorized numpy equivalent of _boost_outcomes_loop."""
+    ramp_factor = np.minimum(days_since_start / ramp_days, 1.0) if ramp_days > 0 else 1.0
+    boosted_quantity = np.maximum(min_units, (ordered_units * (1 + effect_size * ramp_factor)).astype(np.int64))
+    y1_revenue = np.where(days_since_start >= 0, np.round(boosted_quantity * unit_price, 2), y0_revenue)
+    return boosted_quantity, y1_revenue
+
+
+_boost_outcomes = njit(cache=True)(_boost_outcomes_loop) if njit is not None else _boost_outcomes_numpy
 
 
 def _regenerate_product_details(
@@ -249,7 +275,7 @@ def _regenerate_product_details(
     treatment_products = []
 
     for product in products:
-        product_copy = copy.deepcopy(product)
+        product_copy = product.copy()
         product_id = product_copy.get("product_identifier", product_copy.get("product_id"))
 
         if product_id in treatment_ids:
@@ -276,7 +302,7 @@ def _regenerate_product_details(
         regenerated_df["enriched"] = True
 
         # Apply quality boost for treated products (0.0 = no boost)
-        regenerated_df["quality_score"] = regenerated_df["quality_score"].apply(lambda x: min(x + quality_boost, 1.0))
+        regenerated_df["quality_score"] = (regenerated_df["quality_score"] + quality_boost).clip(upper=1.0)
 
         treatment_products = regenerated_df.to_dict("records")
 
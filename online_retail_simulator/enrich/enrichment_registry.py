@@ -3,9 +3,14 @@ Impact-based enrichment registry for custom user-defined enrichment functions.
 
 This module provides a registration system that allows users to register their own
 impact-based enrichment functions.
+
+Enrichment functions receive metrics either as a list of record dictionaries
+(``accepts="records"``, the default) or as a pandas DataFrame
+(``accepts="dataframe"``), which avoids converting large metrics tables to and
+from Python dictionaries.
 """
 
-from typing import Callable, List
+from typing import Callable, List, Set
 
 from online_retail_simulator.core import FunctionRegistry
 
@@ -22,6 +27,14 @@ def _load_enrichment_defaults(registry: FunctionRegistry) -> None:
     registry.register("probability_boost", probability_boost)
     registry.register("product_detail_boost", product_detail_boost)
 
+    # Built-in functions operate on DataFrames directly
+    _dataframe_functions.update({"quantity_boost", "probability_boost", "product_detail_boost"})
+
+
+# Names of registered functions that take and return DataFrames
+_dataframe_functions: Set[str] = set()
+
+_ACCEPTS_OPTIONS = ("records", "dataframe")
 
 # Registry instance
 _enrichment_registry = FunctionRegistry(
@@ -32,9 +45,24 @@ _enrichment_registry = FunctionRegistry(
 
 
 # Public API functions
-def register_enrichment_function(name: str, func: Callable) -> None:
-    """Register an enrichment function."""
+def register_enrichment_function(name: str, func: Callable, *, accepts: str = "records") -> None:
+    """
+    Register an enrichment function.
+
+    Args:
+        name: Name to register the function under
+        func: Enrichment function with a 'metrics' parameter
+        accepts: "records" if func takes and returns a list of metric dicts,
+            "dataframe" if it takes and returns a pandas DataFrame
+    """
+    if accepts not in _ACCEPTS_OPTIONS:
+        raise ValueError(f"accepts must be one of {list(_ACCEPTS_OPTIONS)}, got '{accepts}'")
+
     _enrichment_registry.register(name, func)
+    if accepts == "dataframe":
+        _dataframe_functions.add(name)
+    else:
+        _dataframe_functions.discard(name)
 
 
 def register_enrichment_module(module_name: str) -> None:
@@ -50,6 +78,7 @@ def list_enrichment_functions() -> List[str]:
 def clear_enrichment_registry() -> None:
     """Clear all registered enrichment functions."""
     _enrichment_registry.clear()
+    _dataframe_functions.clear()
 
 
 def load_effect_function(module_name: str, function_name: str) -> Callable:
@@ -64,3 +93,9 @@ def load_effect_function(module_name: str, function_name: str) -> Callable:
         Treatment effect function
     """
     return _enrichment_registry.get(function_name)
+
+
+def accepts_dataframe(function_name: str) -> bool:
+    """Check whether a registered enrichment function takes and returns DataFrames."""
+    _enrichment_registry.get(function_name)  # Ensures defaults are loaded and the name exists
+    return function_name in _dataframe_functions
@@ -2,15 +2,21 @@
 Job management functions for simulation data.
 """
 
+import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Optional
 
 import pandas as pd
+import yaml
 from artifact_store import ArtifactStore
 
+from ..core import csv_io, json_io
+
 
 @dataclass
 class JobInfo:
@@ -18,25 +24,58 @@ class JobInfo:
 
     job_id: str
     storage_path: str
+    file_format: str = "csv"
 
     def __str__(self) -> str:
         return self.job_id
 
+    @cached_property
+    def _store(self) -> ArtifactStore:
+        # Built once per job, save_df/load_df and the job helpers reuse it for every artifact
+        return ArtifactStore(f"{self.storage_path}/{self.job_id}")
+
     def get_store(self) -> ArtifactStore:
         """Get an ArtifactStore for this job's directory."""
-        return ArtifactStore(f"{self.storage_path}/{self.job_id}")
+        return self._store
 
     def save_df(self, name: str, df: pd.DataFrame) -> None:
-        """Save a DataFrame to this job's directory."""
-        store = self.get_store()
-        store.write_csv(f"{name}.csv", df)
+        """Save a DataFrame to this job's directory in the job's file format."""
+        store = self._store
+        if self.file_format == "parquet":
+            full_path = store.full_path(f"{name}.parquet")
+            if "://" not in full_path:
+                os.makedirs(os.path.dirname(full_path) or ".", exist_ok=True)
+            # zstd compresses job data well below the default snappy at the same write speed
+            df.to_parquet(full_path, index=False, compression="zstd")
+        else:
+            store.write_csv(f"{name}.csv", df)
 
     def load_df(self, name: str) -> Optional[pd.DataFrame]:
-        """Load a DataFrame from this job's directory."""
-        store = self.get_store()
-        file_path = f"{name}.csv"
+        """
+        Load a DataFrame from this job's directory.
+
+        The file in the job's own format is preferred, so a stale artifact left in the
+        other format does not hide a newer one; the other format is only read if the
+        job's own file is missing.
+        """
+        formats = ("parquet", "csv") if self.file_format == "parquet" else ("csv", "parquet")
+        for file_format in formats:
+            df = self._read_df(name, file_format)
+            if df is not None:
+                return df
+        return None
+
+    def _read_df(self, name: str, file_format: str) -> Optional[pd.DataFrame]:
+        """Read the named DataFrame in one file format, or return None if that file is missing."""
+        store = self._store
+        file_path = f"{name}.{file_format}"
         if not store.exists(file_path):
             return None
+        full_path = store.full_path(file_path)
+        if file_format == "parquet":
+            return pd.read_parquet(full_path)
+        if "://" not in full_path:
+            return csv_io.read_csv(full_path)
         return store.read_csv(file_path)
 
 
@@ -47,13 +86,13 @@ def generate_job_id(prefix: str = "job") -> str:
     return f"{prefix}-{timestamp}-{short_uuid}"
 
 
-def create_job(config: Dict, config_path: str, job_id: Optional[str] = None) -> JobInfo:
+def create_job(config: Dict, config_path: Optional[str], job_id: Optional[str] = None) -> JobInfo:
     """
     Create a new job directory with config.
 
     Args:
-        config: Configuration dictionary (expects STORAGE.PATH)
-        config_path: Path to original config file
+        config: Configuration dictionary (expects STORAGE.PATH, optionally STORAGE.FORMAT)
+        config_path: Path to original config file, or None for in-memory configs
         job_id: Optional job ID, auto-generated if not provided
 
     Returns:
@@ -64,10 +103,13 @@ def create_job(config: Dict, config_path: str, job_id: Optional[str] = None) ->
         job_id = generate_job_id(prefix)
 
     storage_path = config.get("STORAGE", {}).get("PATH", ".")
-    job_info = JobInfo(job_id=job_id, storage_path=storage_path)
+    file_format = config.get("STORAGE", {}).get("FORMAT", "csv")
+    job_info = JobInfo(job_id=job_id, storage_path=storage_path, file_format=file_format)
 
-    # Copy original config using ArtifactStore
-    if Path(config_path).exists():
+    # Copy original config using ArtifactStore, or dump in-memory configs
+    if config_path is None:
+        job_info.get_store().write_text("config.yaml", yaml.safe_dump(config, sort_keys=False))
+    elif Path(config_path).exists():
         store = job_info.get_store()
         source_store, filename = ArtifactStore.from_file_path(config_path)
         config_content = source_store.read_text(filename)
@@ -76,21 +118,21 @@ def create_job(config: Dict, config_path: str, job_id: Optional[str] = None) ->
     return job_info
 
 
-def save_job_metadata(job_info: JobInfo, config: Dict, config_path: str, **extra) -> None:
+def save_job_metadata(job_info: JobInfo, config: Dict, config_path: Optional[str], **extra) -> None:
     """
     Save/update job metadata.
 
     Args:
         job_info: JobInfo for the job
         config: Configuration dictionary
-        config_path: Path to config file
+        config_path: Path to config file, or None for in-memory configs
         **extra: Additional metadata fields (e.g., num_products=10, is_enriched=True)
     """
     store = job_info.get_store()
 
     # Load existing metadata or start fresh
     if store.exists("metadata.json"):
-        metadata = store.read_json("metadata.json")
+        metadata = json_io.loads(store.read_text("metadata.json"))
     else:
         metadata = {
             "job_id": job_info.job_id,
@@ -102,14 +144,14 @@ def save_job_metadata(job_info: JobInfo, config: Dict, config_path: str, **extra
     metadata.update(extra)
     metadata["timestamp"] = datetime.now().isoformat()
 
-    store.write_json("metadata.json", metadata)
+    store.write_text("metadata.json", json_io.dumps(metadata))
 
 
 def save_job_data(
     products_df: pd.DataFrame,
     metrics_df: pd.DataFrame,
     config: Dict,
-    config_path: str,
+    config_path: Optional[str],
     job_id: Optional[str] = None,
 ) -> JobInfo:
     """
@@ -119,7 +161,7 @@ def save_job_data(
         products_df: Product characteristics DataFrame
         metrics_df: Product metrics DataFrame
         config: Configuration dictionary
-        config_path: Path to original config file
+        config_path: Path to original config file, or None for in-memory configs
         job_id: Optional job ID, auto-generated if not provided
 
     Returns:
@@ -192,7 +234,7 @@ def load_job_metadata(job_info: JobInfo) -> Dict:
     if not store.exists("metadata.json"):
         raise FileNotFoundError(f"Metadata file not found: {store.full_path('metadata.json')}")
 
-    return store.read_json("metadata.json")
+    return json_io.loads(store.read_text("metadata.json"))
 
 
 def list_jobs(storage_path: str = ".") -> List[str]:
@@ -205,14 +247,12 @@ def list_jobs(storage_path: str = ".") -> List[str]:
     Returns:
         List of job IDs sorted by creation time (newest first)
     """
-    output_dir = Path(storage_path)
-    if not output_dir.exists():
+    if not os.path.isdir(storage_path):
         return []
 
-    jobs = []
-    for job_dir in output_dir.iterdir():
-        if job_dir.is_dir() and job_dir.name.startswith("job-"):
-            jobs.append(job_dir.name)
+    # scandir entries carry the file type from the directory listing, avoiding a stat per entry
+    with os.scandir(storage_path) as entries:
+        jobs = [entry.name for entry in entries if entry.name.startswith("job-") and entry.is_dir()]
 
     return sorted(jobs, reverse=True)
 
@@ -233,13 +273,16 @@ def cleanup_old_jobs(storage_path: str = ".", keep_count: int = 10) -> List[str]
         return []
 
     jobs_to_remove = jobs[keep_count:]
-    removed_jobs = []
 
-    for job_id in jobs_to_remove:
-        job_info = JobInfo(job_id=job_id, storage_path=storage_path)
-        store = job_info.get_store()
-        if store.exists(""):
-            store.delete()
-            removed_jobs.append(job_id)
+    def remove_job(job_id: str) -> bool:
+        store = JobInfo(job_id=job_id, storage_path=storage_path).get_store()
+        if not store.exists(""):
+            return False
+        store.delete()
+        return True
+
+    # Deleting job directories is I/O bound and independent per job, so run them concurrently
+    with ThreadPoolExecutor(max_workers=min(8, len(jobs_to_remove))) as pool:
+        removed = list(pool.map(remove_job, jobs_to_remove))
 
-    return removed_jobs
+    return [job_id for job_id, was_removed in zip(jobs_to_remove, removed) if was_removed]
@@ -1,6 +1,7 @@
 """Simulation module for generating synthetic retail data."""
 
 from .metrics import simulate_metrics
+from .metrics_synthesizer_based import fit_metrics_synthesizer, sample_metrics_synthesizer
 from .product_details import simulate_product_details
 from .products import simulate_products
 from .rule_registry import (
@@ -17,6 +18,8 @@ __all__ = [
     "simulate_products",
     "simulate_product_details",
     "simulate_metrics",
+    "fit_metrics_synthesizer",
+    "sample_metrics_synthesizer",
     "register_products_function",
     "register_metrics_function",
     "register_simulation_module",
@@ -3,26 +3,37 @@ Interface for simulating product metrics.
 Dispatches to appropriate backend based on config.
 """
 
+from typing import Dict, Optional, Union
+
+import pandas as pd
+
 from ..config_processor import process_config
 from ..core.backends import BackendRegistry
 from ..manage import save_job_metadata
 
 
-def simulate_metrics(job_info, config_path: str):
+def simulate_metrics(job_info, config: Union[str, Dict], products_df: Optional[pd.DataFrame] = None):
     """
     Simulate product metrics using the backend specified in config.
 
     Args:
         job_info: JobInfo containing products.csv
-        config_path: Path to configuration file
+        config: Path to configuration file, or an already loaded config dictionary
+        products_df: Optional products already in memory (as saved in the job). If provided,
+                     products.csv is not read back from storage.
 
     Returns:
         JobInfo: Same job, now also containing metrics.csv
     """
-    config = process_config(config_path)
+    config_path = config if isinstance(config, str) else None
+    return _simulate_metrics(job_info, process_config(config), config_path, products_df)
 
-    # Load products from job
-    products_df = job_info.load_df("products")
+
+def _simulate_metrics(job_info, config: Dict, config_path: Optional[str], products_df: Optional[pd.DataFrame] = None):
+    """Simulate and save metrics from a processed config."""
+    # Load products from job unless the caller still holds them
+    if products_df is None:
+        products_df = job_info.load_df("products")
     if products_df is None:
         raise FileNotFoundError(f"products.csv not found in job {job_info.job_id}")
 
@@ -4,8 +4,29 @@ Rule-based product metrics simulation (minimal skeleton).
 
 from typing import Dict
 
+import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional, the numpy implementation is used without it
+    njit = None
+    prange = range
+
+
+def _cumulative_distribution(weights) -> np.ndarray:
+    """Normalized cumulative distribution of integer weights, as Generator.choice computes it."""
+    weights = np.asarray(weights, dtype=np.float64)
+    cdf = (weights / weights.sum()).cumsum()
+    return cdf / cdf[-1]
+
+
+# Categorical distributions of the funnel draws, precomputed once for every call
+_IMPRESSION_VALUES = np.array([10, 25, 50, 100, 200], dtype=np.int64)
+_IMPRESSION_CDF = _cumulative_distribution([40, 30, 15, 10, 5])
+_UNIT_VALUES = np.array([1, 2, 3, 4, 5], dtype=np.int64)
+_UNIT_CDF = _cumulative_distribution([50, 25, 15, 7, 3])
+
 
 def simulate_metrics_rule_based(products: pd.DataFrame, config: Dict) -> pd.DataFrame:
     """
@@ -18,20 +39,20 @@ def simulate_metrics_rule_based(products: pd.DataFrame, config: Dict) -> pd.Data
         config: Complete configuration dictionary
 
     Returns:
-        DataFrame of product metrics (one row per product per time period).
+        DataFrame of product metrics (one row per product per time period, or only the
+        rows with ordered units when PARAMS.drop_zero_sales is set).
         Columns: product_identifier, category, price, date, impressions, visits,
         cart_adds, ordered_units, revenue.
     """
     from datetime import datetime, timedelta
 
-    import numpy as np
-
     params = config["RULE"]["METRICS"]["PARAMS"]
     date_start = params["date_start"]
     date_end = params["date_end"]
     sale_prob = params["sale_prob"]
     seed = params["seed"]
     granularity = params["granularity"]
+    drop_zero_sales = params.get("drop_zero_sales", False)
 
     # Extract funnel conversion rates
     impression_to_visit_rate = params["impression_to_visit_rate"]
@@ -52,73 +73,174 @@ def simulate_metrics_rule_based(products: pd.DataFrame, config: Dict) -> pd.Data
         # Move end_date forward to Sunday of that week
         end_date = end_date + timedelta(days=(6 - end_date.weekday()))
 
-    rows = []
-    current_date = start_date
-    while current_date <= end_date:
-        for _, prod in products.iterrows():
-            # Quality score affects conversion probability (if available)
-            # Maps quality_score [0,1] to multiplier [0.8, 1.2]
-            # Default 0.5 = multiplier 1.0 (no effect) when quality_score not present
-            quality_score = prod.get("quality_score", 0.5)
-            quality_multiplier = 0.8 + (quality_score * 0.4)
-            adjusted_sale_prob = min(sale_prob * quality_multiplier, 1.0)
-
-            # Determine if funnel activity occurs
-            funnel_activity = rng.random() < adjusted_sale_prob
-
-            if funnel_activity:
-                # Generate funnel metrics top-down
-                impression_weights = np.array([40, 30, 15, 10, 5])
-                impressions = rng.choice([10, 25, 50, 100, 200], p=impression_weights / impression_weights.sum())
-
-                visits_base = impressions * impression_to_visit_rate
-                visits = max(1, int(visits_base * rng.uniform(0.8, 1.2)))
-
-                cart_base = visits * visit_to_cart_rate
-                cart_adds = max(0, int(cart_base * rng.uniform(0.7, 1.3)))
-
-                order_base = cart_adds * cart_to_order_rate
-                order_potential = max(0, int(order_base))
-
-                if order_potential > 0 and cart_adds > 0:
-                    unit_weights = np.array([50, 25, 15, 7, 3])
-                    ordered_units = rng.choice([1, 2, 3, 4, 5], p=unit_weights / unit_weights.sum())
-                    # Cap ordered_units to cart_adds (funnel constraint)
-                    ordered_units = min(ordered_units, cart_adds)
-                else:
-                    ordered_units = 0
-
-                revenue = round(prod["price"] * ordered_units, 2)
-            else:
-                # No funnel activity
-                impressions = 0
-                visits = 0
-                cart_adds = 0
-                ordered_units = 0
-                revenue = 0.0
-
-            # Build row with all metrics
-            row = prod.to_dict()
-            row["date"] = current_date.strftime("%Y-%m-%d")
-            row["impressions"] = impressions
-            row["visits"] = visits
-            row["cart_adds"] = cart_adds
-            row["ordered_units"] = ordered_units
-            row["revenue"] = revenue
-            rows.append(row)
-
-        current_date += timedelta(days=1)
-
-    daily_df = pd.DataFrame(rows)
-
-    # Aggregate to weekly if requested
+    # All (day, product) draws are made at once on arrays of shape (n_days, n_products);
+    # flattening them row-major gives the day-by-day, product-by-product output order
+    n_days = max(0, (end_date - start_date).days + 1)
+    n_products = len(products)
+    shape = (n_days, n_products)
+
+    # Quality score affects conversion probability (if available)
+    # Maps quality_score [0,1] to multiplier [0.8, 1.2]
+    # Default 0.5 = multiplier 1.0 (no effect) when quality_score not present
+    if "quality_score" in products.columns:
+        quality_scores = products["quality_score"].to_numpy(dtype=np.float64)
+    else:
+        quality_scores = np.full(n_products, 0.5)
+    adjusted_sale_prob = np.minimum(sale_prob * (0.8 + quality_scores * 0.4), 1.0)
+
+    # Determine if funnel activity occurs
+    funnel_activity = rng.random(shape) < adjusted_sale_prob
+
+    # Generate funnel metrics top-down
+    impressions = _draw_categorical(rng, _IMPRESSION_VALUES, _IMPRESSION_CDF, shape)
+
+    visit_noise = rng.uniform(0.8, 1.2, size=shape)
+    cart_noise = rng.uniform(0.7, 1.3, size=shape)
+
+    units = _draw_categorical(rng, _UNIT_VALUES, _UNIT_CDF, shape)
+
+    # Turn the draws into funnel metrics; no funnel activity means all metrics are zero
+    impressions, visits, cart_adds, ordered_units, revenue = _funnel_metrics(
+        funnel_activity,
+        impressions,
+        visit_noise,
+        cart_noise,
+        units,
+        products["price"].to_numpy(dtype=np.float64),
+        float(impression_to_visit_rate),
+        float(visit_to_cart_rate),
+        float(cart_to_order_rate),
+    )
+
+    metric_arrays = {
+        "impressions": impressions,
+        "visits": visits,
+        "cart_adds": cart_adds,
+        "ordered_units": ordered_units,
+        "revenue": revenue,
+    }
+
+    # Weekly metrics are summed straight from the (day, product) arrays. Weekly totals also
+    # need the impressions of days without sales, so weeks are only filtered afterwards.
     if granularity == "weekly":
-        return _aggregate_to_weekly(daily_df, products)
+        weekly_df = _aggregate_to_weekly(metric_arrays, products, start_date)
+        if drop_zero_sales:
+            return weekly_df[weekly_df["ordered_units"] > 0].reset_index(drop=True)
+        return weekly_df
+
+    # Product attributes followed by the metric columns, built as one dict of column arrays
+    # (take keeps each attribute's dtype) so the frame is assembled in a single step
+    product_idx = np.tile(np.arange(n_products), n_days)
+    date_values = np.repeat(_date_strings(start_date, n_days), n_products)
+    metric_values = {name: values.ravel() for name, values in metric_arrays.items()}
+
+    # Optionally keep only rows with sales, filtering the arrays before any rows are built
+    if drop_zero_sales:
+        keep = metric_values["ordered_units"] > 0
+        product_idx, date_values = product_idx[keep], date_values[keep]
+        metric_values = {name: values[keep] for name, values in metric_values.items()}
+
+    columns = {column: products[column].array.take(product_idx) for column in products.columns}
+    columns["date"] = date_values
+    columns.update(metric_values)
+    # Every column is a freshly built array, so the frame can own them without another copy
+    return pd.DataFrame(columns, copy=False)
+
+
+def _date_strings(start_date, n_days: int, step: int = 1) -> np.ndarray:
+    """YYYY-MM-DD strings of n_days dates spaced step days apart, computed on integer day numbers."""
+    days = np.datetime64(start_date.date(), "D") + step * np.arange(n_days)
+    return np.datetime_as_string(days, unit="D").astype(object)
+
 
-    return daily_df
+def _draw_categorical(rng: np.random.Generator, values: np.ndarray, cdf: np.ndarray, shape: tuple) -> np.ndarray:
+    """
+    Draw values by inverse transform sampling from a precomputed cumulative distribution.
 
+    Consumes the random stream exactly as rng.choice(values, size=shape, p=...) does and
+    returns the same draws, without re-validating and re-accumulating the weights.
+    """
+    uniforms = rng.random(shape)
+    # With only a handful of categories, counting the thresholds each draw reaches is a few
+    # branchless comparisons over the array, faster than a binary search per element; it
+    # gives the same index as searchsorted(cdf, uniforms, side="right") since the last is 1.0
+    idx = np.zeros(shape, dtype=np.intp)
+    for threshold in cdf[:-1]:
+        idx += uniforms >= threshold
+    return values[idx]
+
+
+def _funnel_metrics_loop(
+    funnel_activity,
+    impressions,
+    visit_noise,
+    cart_noise,
+    units,
+    prices,
+    impression_to_visit_rate,
+    visit_to_cart_rate,
+    cart_to_order_rate,
+):
+    """
+    Funnel metrics per (day, product) from the random draws (explicit loop, compiled with numba when available).
 
-def _aggregate_to_weekly(daily_df: pd.DataFrame, products: pd.DataFrame) -> pd.DataFrame:
+    Days are independent, so the compiled loop runs them in parallel.
+    """
+    n_days, n_products = impressions.shape
+    out_impressions = np.zeros((n_days, n_products), dtype=np.int64)
+    out_visits = np.zeros((n_days, n_products), dtype=np.int64)
+    out_cart_adds = np.zeros((n_days, n_products), dtype=np.int64)
+    out_ordered_units = np.zeros((n_days, n_products), dtype=np.int64)
+    out_revenue = np.zeros((n_days, n_products), dtype=np.float64)
+    for d in prange(n_days):
+        for p in range(n_products):
+            if not funnel_activity[d, p]:
+                continue
+            visits = max(1, int(impressions[d, p] * impression_to_visit_rate * visit_noise[d, p]))
+            cart_adds = max(0, int(visits * visit_to_cart_rate * cart_noise[d, p]))
+            order_potential = max(0, int(cart_adds * cart_to_order_rate))
+            # Cap ordered_units to cart_adds (funnel constraint)
+            ordered_units = min(units[d, p], cart_adds) if order_potential > 0 and cart_adds > 0 else 0
+            out_impressions[d, p] = impressions[d, p]
+            out_visits[d, p] = visits
+            out_cart_adds[d, p] = cart_adds
+            out_ordered_units[d, p] = ordered_units
+            out_revenue[d, p] = np.round(prices[p] * ordered_units, 2)
+    return out_impressions, out_visits, out_cart_adds, out_ordered_units, out_revenue
+
+
+def _funnel_metrics_numpy(
+    funnel_activity,
+    impressions,
+    visit_noise,
+    cart_noise,
+    units,
+    prices,
+    impression_to_visit_rate,
+    visit_to_cart_rate,
+    cart_to_order_rate,
+):
+    """Vectorized numpy equivalent of _funnel_metrics_loop."""
+    visits = np.maximum(1, (impressions * impression_to_visit_rate * visit_noise).astype(np.int64))
+    cart_adds = np.maximum(0, (visits * visit_to_cart_rate * cart_noise).astype(np.int64))
+    order_potential = np.maximum(0, (cart_adds * cart_to_order_rate).astype(np.int64))
+    # Cap ordered_units to cart_adds (funnel constraint)
+    ordered_units = np.where((order_potential > 0) & (cart_adds > 0), np.minimum(units, cart_adds), 0)
+    revenue = np.round(prices * ordered_units, 2)
+
+    return (
+        np.where(funnel_activity, impressions, 0),
+        np.where(funnel_activity, visits, 0),
+        np.where(funnel_activity, cart_adds, 0),
+        np.where(funnel_activity, ordered_units, 0),
+        np.where(funnel_activity, revenue, 0.0),
+    )
+
+
+_funnel_metrics = njit(parallel=True, cache=True)(_funnel_metrics_loop) if njit is not None else _funnel_metrics_numpy
+
+
+def _aggregate_to_weekly(metric_arrays: Dict[str, np.ndarray], products: pd.DataFrame, start_date) -> pd.DataFrame:
     """
     Aggregate daily metrics to weekly granularity using ISO weeks (Monday-Sunday).
 
@@ -126,61 +248,43 @@ def _aggregate_to_weekly(daily_df: pd.DataFrame, products: pd.DataFrame) -> pd.D
     This ensures the weekly DataFrame has the same completeness as daily data.
 
     Args:
-        daily_df: Daily metrics DataFrame with funnel columns
+        metric_arrays: Daily funnel metrics by column, arrays of shape (n_days, n_products)
+            whose first day is a Monday and whose number of days is a multiple of 7
         products: Original products DataFrame
+        start_date: Date of the first day (a Monday)
 
     Returns:
-        Weekly aggregated DataFrame with date = week start (Monday)
+        Weekly aggregated DataFrame with date = week start (Monday), one row per product and week
         Columns: [product_identifier, category, price, date, impressions, visits, cart_adds,
                  ordered_units, revenue]
     """
-    # Convert date strings to datetime for week calculation
-    df = daily_df.copy()
-    df["date"] = pd.to_datetime(df["date"])
-
-    # Get ISO week start (Monday) for each date
-    df["week_start"] = df["date"] - pd.to_timedelta(df["date"].dt.weekday, unit="d")
-
-    # Get unique weeks in the date range
-    unique_weeks = df["week_start"].unique()
-
-    # Create complete product × week grid to ensure zero-sale rows are included
-    products_grid = products[["product_identifier", "category", "price"]].copy()
-    week_grid = pd.DataFrame({"week_start": unique_weeks})
-    complete_grid = products_grid.merge(week_grid, how="cross")
-
-    # Aggregate actual sales by product and week
-    sales_agg = df.groupby(["product_identifier", "category", "price", "week_start"], as_index=False).agg(
-        {"impressions": "sum", "visits": "sum", "cart_adds": "sum", "ordered_units": "sum", "revenue": "sum"}
-    )
-
-    # Merge with complete grid to fill in zero-sale weeks
-    weekly = complete_grid.merge(sales_agg, on=["product_identifier", "category", "price", "week_start"], how="left")
-
-    # Fill NaN values with 0 (weeks with no sales)
-    weekly["impressions"] = weekly["impressions"].fillna(0).astype(int)
-    weekly["visits"] = weekly["visits"].fillna(0).astype(int)
-    weekly["cart_adds"] = weekly["cart_adds"].fillna(0).astype(int)
-    weekly["ordered_units"] = weekly["ordered_units"].fillna(0).astype(int)
-    weekly["revenue"] = weekly["revenue"].fillna(0.0)
-
-    # Convert week_start back to string format YYYY-MM-DD
-    weekly["date"] = weekly["week_start"].dt.strftime("%Y-%m-%d")
-    weekly = weekly.drop(columns=["week_start"])
-
-    # Reorder columns to match schema
-    weekly = weekly[
-        [
-            "product_identifier",
-            "category",
-            "price",
-            "date",
-            "impressions",
-            "visits",
-            "cart_adds",
-            "ordered_units",
-            "revenue",
-        ]
-    ]
-
-    return weekly
+    n_days, n_products = metric_arrays["impressions"].shape
+    n_weeks = n_days // 7
+
+    # Rows are ordered product by product, each product listing its weeks in date order
+    product_idx = np.repeat(np.arange(n_products), n_weeks)
+    columns = {
+        column: products[column].array.take(product_idx) for column in ["product_identifier", "category", "price"]
+    }
+    columns["date"] = np.tile(_date_strings(start_date, n_weeks, step=7), n_products)
+
+    # Sum the seven days of every week; revenue uses the compensated summation of a grouped
+    # sum so that weekly totals do not pick up floating point error from the daily cents
+    for name, values in metric_arrays.items():
+        days = values.reshape(n_weeks, 7, n_products)
+        weekly = _compensated_sum(days) if values.dtype.kind == "f" else days.sum(axis=1)
+        columns[name] = weekly.T.ravel()
+
+    return pd.DataFrame(columns, copy=False)
+
+
+def _compensated_sum(days: np.ndarray) -> np.ndarray:
+    """Kahan sum over the day axis of an (n_weeks, 7, n_products) array, in day order."""
+    total = np.zeros((days.shape[0], days.shape[2]))
+    compensation = np.zeros_like(total)
+    for day in range(days.shape[1]):
+        y = days[:, day, :] - compensation
+        t = total + y
+        compensation = (t - total) - y
+        total = t
+    return total
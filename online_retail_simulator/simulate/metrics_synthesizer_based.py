@@ -4,50 +4,53 @@ Takes products DataFrame and config path.
 No error handling, hard failures only.
 """
 
-from typing import Dict
+from typing import Dict, Optional
 
-import numpy as np
 import pandas as pd
 
+from .synthesizer_models import fit_gaussian_copula, require_sdv, sample_synthesizer
 
-def simulate_metrics_synthesizer_based(products: pd.DataFrame, config: Dict) -> pd.DataFrame:
+
+def fit_metrics_synthesizer(config: Dict):
     """
-    Generate synthetic product metrics using Gaussian Copula synthesizer.
+    Fit (or reuse) the metrics synthesizer for a configuration.
+
+    The model is cached while the training file is unchanged, so repeated calls are cheap.
     Args:
-        products: DataFrame of products (unused in current implementation)
         config: Complete configuration dictionary
     Returns:
-        DataFrame of synthetic metrics
+        Fitted Gaussian Copula synthesizer, to be passed to sample_metrics_synthesizer
     """
-    try:
-        from sdv.metadata import SingleTableMetadata
-        from sdv.single_table import GaussianCopulaSynthesizer
-    except ImportError:
-        raise ImportError(
-            "SDV is required for synthesizer-based simulation. "
-            "Install with: pip install online-retail-simulator[synthesizer]"
-        )
+    require_sdv()
+    return fit_gaussian_copula(config["SYNTHESIZER"]["METRICS"]["PARAMS"]["training_data_path"])
 
-    params = config["SYNTHESIZER"]["METRICS"]["PARAMS"]
-    training_data_path, num_rows, seed = (
-        params["training_data_path"],
-        params["num_rows"],
-        params["seed"],
-    )
-
-    # Load training data
-    training_data = pd.read_csv(training_data_path)
 
-    # Step 1: Create metadata and synthesizer
-    metadata = SingleTableMetadata()
-    metadata.detect_from_dataframe(training_data)
-    synthesizer = GaussianCopulaSynthesizer(metadata)
+def sample_metrics_synthesizer(synthesizer, num_rows: int, seed: Optional[int], num_samples: int = 1) -> pd.DataFrame:
+    """
+    Generate synthetic product metrics from a fitted synthesizer.
+    Args:
+        synthesizer: Synthesizer returned by fit_metrics_synthesizer
+        num_rows: Number of metric rows per sample
+        seed: Random seed, or None
+        num_samples: Number of Monte Carlo draws, labelled by sample_id when > 1
+    Returns:
+        DataFrame of synthetic metrics
+    """
+    return sample_synthesizer(synthesizer, num_rows, seed, num_samples)
 
-    # Step 2: Train the synthesizer
-    synthesizer.fit(training_data)
 
-    # Step 3: Generate synthetic data with seed
-    np.random.seed(seed)
-    synthetic_metrics = synthesizer.sample(num_rows=num_rows)
+def simulate_metrics_synthesizer_based(products: pd.DataFrame, config: Dict) -> pd.DataFrame:
+    """
+    Generate synthetic product metrics using Gaussian Copula synthesizer.
 
-    return synthetic_metrics
+    Convenience wrapper around fit_metrics_synthesizer and sample_metrics_synthesizer.
+    Args:
+        products: DataFrame of products (unused in current implementation)
+        config: Complete configuration dictionary
+    Returns:
+        DataFrame of synthetic metrics; with PARAMS.num_samples > 1 the draws are stacked
+        and labelled by a leading sample_id column
+    """
+    params = config["SYNTHESIZER"]["METRICS"]["PARAMS"]
+    synthesizer = fit_metrics_synthesizer(config)
+    return sample_metrics_synthesizer(synthesizer, params["num_rows"], params["seed"], params.get("num_samples", 1))
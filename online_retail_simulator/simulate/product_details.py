@@ -1,18 +1,24 @@
 """Product details simulation with backend dispatch."""
 
+import importlib
+from typing import Dict, Optional, Union
+
+import pandas as pd
+
 from ..config_processor import process_config
 from ..manage import JobInfo, save_job_metadata
-from .product_details_mock import simulate_product_details_mock
-from .product_details_ollama import simulate_product_details_ollama
 
-# Registry of product details backends
+# Registry of product details backends, mapping function name to its module. Backends are
+# imported on first use so that e.g. the Ollama HTTP client stack is only loaded when needed.
 PRODUCT_DETAILS_REGISTRY = {
-    "simulate_product_details_mock": simulate_product_details_mock,
-    "simulate_product_details_ollama": simulate_product_details_ollama,
+    "simulate_product_details_mock": ".product_details_mock",
+    "simulate_product_details_ollama": ".product_details_ollama",
 }
 
 
-def simulate_product_details(job_info: JobInfo, config_path: str) -> JobInfo:
+def simulate_product_details(
+    job_info: JobInfo, config: Union[str, Dict], products_df: Optional[pd.DataFrame] = None
+) -> JobInfo:
     """
     Simulate product details using configured backend.
 
@@ -25,20 +31,32 @@ def simulate_product_details(job_info: JobInfo, config_path: str) -> JobInfo:
 
     Args:
         job_info: Job containing products.csv
-        config_path: Path to configuration file
+        config: Path to configuration file, or an already loaded config dictionary
+        products_df: Optional products already in memory (as saved in the job). If provided,
+                     products.csv is not read back from storage.
 
     Returns:
         JobInfo: Same job with updated products.csv
     """
-    config = process_config(config_path)
+    config_path = config if isinstance(config, str) else None
+    # Only read here (backend name and metadata), so the cached config need not be copied
+    return _simulate_product_details(job_info, process_config(config, shared=True), config_path, products_df)
+
+
+def _simulate_product_details(
+    job_info: JobInfo, config: Dict, config_path: Optional[str], products_df: Optional[pd.DataFrame] = None
+) -> JobInfo:
+    """Simulate and save product details from a processed config."""
     product_details_config = config.get("PRODUCT_DETAILS", {})
     function_name = product_details_config.get("FUNCTION", "simulate_product_details_mock")
 
     if function_name not in PRODUCT_DETAILS_REGISTRY:
         raise ValueError(f"Unknown product details function: {function_name}")
 
-    backend_fn = PRODUCT_DETAILS_REGISTRY[function_name]
-    products_df = job_info.load_df("products")
+    backend_module = importlib.import_module(PRODUCT_DETAILS_REGISTRY[function_name], package=__package__)
+    backend_fn = getattr(backend_module, function_name)
+    if products_df is None:
+        products_df = job_info.load_df("products")
     detailed_df = backend_fn(products_df)
 
     job_info.save_df("products", detailed_df)
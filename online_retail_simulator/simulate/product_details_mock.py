@@ -1,5 +1,7 @@
 """Mock product details generation (rule-based)."""
 
+import functools
+
 import numpy as np
 import pandas as pd
 
@@ -80,9 +82,12 @@ MOCK_DATA_TREATMENT = {
 }
 
 
+@functools.lru_cache(maxsize=256)
 def _get_mock_data(category: str, treatment_mode: bool = False) -> dict:
     """Get mock data templates for a category.
 
+    Cached, since catalogs repeat a handful of categories across many products.
+
     Args:
         category: Product category
         treatment_mode: If True, use enhanced "treatment" templates
@@ -91,8 +96,9 @@ def _get_mock_data(category: str, treatment_mode: bool = False) -> dict:
         Mock data dictionary with brands, adjectives, features
     """
     data_source = MOCK_DATA_TREATMENT if treatment_mode else MOCK_DATA
+    category = category.lower()
     for key in data_source:
-        if key.lower() in category.lower():
+        if key.lower() in category:
             return data_source[key]
     return data_source["default"]
 
@@ -118,32 +124,55 @@ def simulate_product_details_mock(
     _ = prompt_path
 
     rng = np.random.default_rng(seed)
-    results = []
 
-    for product in products_df.to_dict("records"):
-        category = product.get("category", "General")
-        data = _get_mock_data(category, treatment_mode=treatment_mode)
+    # Work on column arrays and draw the random choices in bulk, per group of products
+    # sharing the same mock data, instead of calling the generator for every product
+    n_products = len(products_df)
+    categories = products_df["category"].to_numpy() if "category" in products_df.columns else ["General"] * n_products
+    existing_brands = products_df["brand"].to_numpy() if "brand" in products_df.columns else [None] * n_products
 
-        # Preserve existing brand if present, otherwise generate new one
-        brand = product.get("brand") or rng.choice(data["brands"])
-        adj = rng.choice(data["adjectives"])
-        num_features = min(4, len(data["features"]))
-        features = list(rng.choice(data["features"], size=num_features, replace=False))
-
-        title = f"{brand} {adj} {category} Item"
-        if treatment_mode:
-            description = f"Premium {category.lower()} product with exceptional quality. {features[0]}. {features[1]}."
-        else:
-            description = f"Quality {category.lower()} product for everyday use. {features[0]}. {features[1]}."
-
-        result = {
-            **product,
-            "title": title,
-            "description": description,
-            "brand": brand,
-            "features": features,
-        }
-        result["quality_score"] = calculate_quality_score(result)
-        results.append(result)
-
-    return pd.DataFrame(results)
+    groups = {}
+    for i, category in enumerate(categories):
+        data = _get_mock_data(category, treatment_mode=treatment_mode)
+        groups.setdefault(id(data), (data, []))[1].append(i)
+
+    brand_draws = rng.random(n_products)
+    adjective_draws = rng.random(n_products)
+    drawn_brands = np.empty(n_products, dtype=object)
+    adjectives = np.empty(n_products, dtype=object)
+    features_col = np.empty(n_products, dtype=object)
+    for data, rows in groups.values():
+        rows = np.asarray(rows)
+        brand_options = np.asarray(data["brands"], dtype=object)
+        drawn_brands[rows] = brand_options[(brand_draws[rows] * len(brand_options)).astype(np.int64)]
+        adjective_options = np.asarray(data["adjectives"], dtype=object)
+        adjectives[rows] = adjective_options[(adjective_draws[rows] * len(adjective_options)).astype(np.int64)]
+
+        # Features without replacement: the first num_features of a random permutation per product
+        feature_options = np.asarray(data["features"], dtype=object)
+        num_features = min(4, len(feature_options))
+        picks = np.argsort(rng.random((rows.size, len(feature_options))), axis=1)[:, :num_features]
+        for row, features in zip(rows, feature_options[picks].tolist()):
+            features_col[row] = features
+
+    # Preserve existing brand if present, otherwise use the generated one
+    brands = [existing or drawn for existing, drawn in zip(existing_brands, drawn_brands)]
+    description_prefix = "Premium" if treatment_mode else "Quality"
+    description_suffix = "with exceptional quality" if treatment_mode else "for everyday use"
+    titles = [f"{brand} {adj} {category} Item" for brand, adj, category in zip(brands, adjectives, categories)]
+    descriptions = [
+        f"{description_prefix} {category.lower()} product {description_suffix}. {features[0]}. {features[1]}."
+        for category, features in zip(categories, features_col)
+    ]
+    quality_scores = [
+        calculate_quality_score({"title": title, "description": description, "brand": brand, "features": features})
+        for title, description, brand, features in zip(titles, descriptions, brands, features_col)
+    ]
+
+    return products_df.reset_index(drop=True).assign(
+        title=titles,
+        description=descriptions,
+        brand=brands,
+        features=features_col,
+        quality_score=np.asarray(quality_scores, dtype=np.float64),
+    )
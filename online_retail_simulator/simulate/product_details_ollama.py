@@ -1,15 +1,31 @@
 """Product details generation using Ollama (local LLM)."""
 
-import json
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from ..core import json_io
 from ..quality import calculate_quality_score
 
 OLLAMA_URL = "http://localhost:11434"
 DEFAULT_MODEL = "llama3.2"
 DEFAULT_BATCH_SIZE = 5
+DEFAULT_MAX_WORKERS = 4
+SESSION_POOL_SIZE = 8
+
+# Shared session so HTTP keep-alive and connection pooling carry over between batches and calls.
+# Connection failures (e.g. the server still starting) are retried briefly.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=SESSION_POOL_SIZE,
+    pool_maxsize=SESSION_POOL_SIZE,
+    max_retries=Retry(total=2, backoff_factor=0.1),
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
 
 PROMPT_TEMPLATE = """You are a JSON generator. Generate product details for these e-commerce products.
 Your response must be ONLY valid JSON - no explanations, no code, no markdown.
@@ -37,15 +53,20 @@ def simulate_product_details_ollama(
     model: str = DEFAULT_MODEL,
     ollama_url: str = OLLAMA_URL,
     prompt_path: str = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
 ) -> pd.DataFrame:
     """Generate product details using Ollama (local LLM).
 
+    Batches are sent to the Ollama server concurrently; results keep the input order.
+
     Args:
         products_df: Input products with product_identifier, category, price
         model: Ollama model to use (default: llama3.2)
         ollama_url: Ollama API URL (default: http://localhost:11434)
         prompt_path: Optional path to custom prompt template file.
             Template should contain {products_json} placeholder.
+        max_workers: Maximum number of batches requested concurrently (default: 4, at most
+            SESSION_POOL_SIZE connections are kept open)
 
     Returns:
         DataFrame with added title, description, brand, features
@@ -53,14 +74,23 @@ def simulate_product_details_ollama(
     # Load custom prompt or use default
     prompt_template = _load_prompt_template(prompt_path) if prompt_path else PROMPT_TEMPLATE
 
-    results = []
-    products = products_df.to_dict("records")
+    # Serialize all products in one pass straight from the frame (JSON Lines escapes newlines
+    # inside values, so there is one line per product) and join them into per-batch arrays.
+    # Compact JSON: indentation only adds prompt tokens the model has to process.
+    product_jsons = products_df.to_json(orient="records", lines=True).splitlines()
+    batches = [
+        "[" + ",".join(product_jsons[i : i + DEFAULT_BATCH_SIZE]) + "]"
+        for i in range(0, len(product_jsons), DEFAULT_BATCH_SIZE)
+    ]
+    if not batches:
+        return pd.DataFrame([])
+
+    workers = max(1, min(max_workers, len(batches)))
 
-    for i in range(0, len(products), DEFAULT_BATCH_SIZE):
-        batch = products[i : i + DEFAULT_BATCH_SIZE]
-        prompt = prompt_template.format(products_json=json.dumps(batch, indent=2))
+    def generate_batch(products_json: str) -> list:
+        prompt = prompt_template.format(products_json=products_json)
 
-        response = requests.post(
+        response = _SESSION.post(
             f"{ollama_url}/api/generate",
             json={
                 "model": model,
@@ -72,9 +102,13 @@ def simulate_product_details_ollama(
         response.raise_for_status()
 
         response_text = response.json().get("response", "")
-        batch_results = json.loads(response_text)
+        batch_results = json_io.loads(response_text)
         for result in batch_results:
             result["quality_score"] = calculate_quality_score(result)
-        results.extend(batch_results)
+        return batch_results
+
+    # map preserves batch order regardless of completion order
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = [result for batch_results in pool.map(generate_batch, batches) for result in batch_results]
 
     return pd.DataFrame(results)
@@ -3,23 +3,32 @@ Interface for simulating products.
 Dispatches to appropriate backend based on config.
 """
 
+from typing import Dict, Optional, Tuple, Union
+
+import pandas as pd
+
 from ..config_processor import process_config
 from ..core.backends import BackendRegistry
-from ..manage import create_job, save_job_metadata
+from ..manage import JobInfo, create_job, save_job_metadata
 
 
-def simulate_products(config_path: str):
+def simulate_products(config: Union[str, Dict]):
     """
     Simulate products using the backend specified in config.
 
     Args:
-        config_path: Path to configuration file
+        config: Path to configuration file, or an already loaded config dictionary
 
     Returns:
         JobInfo: Job containing products.csv
     """
-    config = process_config(config_path)
+    config_path = config if isinstance(config, str) else None
+    job_info, _ = _simulate_products(process_config(config), config_path)
+    return job_info
 
+
+def _simulate_products(config: Dict, config_path: Optional[str]) -> Tuple[JobInfo, pd.DataFrame]:
+    """Simulate and save products from a processed config, returning the job and the products still in memory."""
     # Generate products DataFrame via backend
     backend = BackendRegistry.detect_backend(config)
     products_df = backend.simulate_products()
@@ -29,4 +38,4 @@ def simulate_products(config_path: str):
     job_info.save_df("products", products_df)
     save_job_metadata(job_info, config, config_path, num_products=len(products_df))
 
-    return job_info
+    return job_info, products_df
@@ -8,6 +8,8 @@ from typing import Dict, List
 import numpy as np
 import pandas as pd
 
+_IDENTIFIER_CHARS = np.array(list(string.ascii_uppercase + string.digits))
+
 
 def generate_random_product_identifier(rng: np.random.Generator, prefix: str = "B") -> str:
     """Generate a random product identifier.
@@ -15,8 +17,14 @@ def generate_random_product_identifier(rng: np.random.Generator, prefix: str = "
     - Alphanumeric
     - Defaults to starting with 'B'
     """
-    chars = list(string.ascii_uppercase + string.digits)
-    return prefix + "".join(rng.choice(chars) for _ in range(9))
+    return generate_random_product_identifiers(rng, 1, prefix)[0]
+
+
+def generate_random_product_identifiers(rng: np.random.Generator, n: int, prefix: str = "B") -> List[str]:
+    """Generate n random product identifiers, drawing all characters in one call."""
+    chars = rng.choice(_IDENTIFIER_CHARS, size=(n, 9))
+    # Each row of single characters is reinterpreted as one 9-character string
+    return [prefix + suffix for suffix in chars.view("<U9").ravel().tolist()]
 
 
 _CATEGORIES = [
@@ -41,6 +49,10 @@ _PRICE_RANGES = {
     "Health & Beauty": (8, 80),
 }
 
+# Lookup tables indexed by category position, built once for all calls
+_CATEGORY_ARRAY = np.array(_CATEGORIES, dtype=object)
+_PRICE_BOUNDS = np.array([_PRICE_RANGES[category] for category in _CATEGORIES], dtype=np.float64)
+
 
 def simulate_products_rule_based(config: Dict) -> pd.DataFrame:
     """
@@ -54,16 +66,16 @@ def simulate_products_rule_based(config: Dict) -> pd.DataFrame:
     num_products, seed = params["num_products"], params["seed"]
 
     rng = np.random.default_rng(seed)
-    products: List[Dict] = []
-    for i in range(num_products):
-        category = rng.choice(_CATEGORIES)
-        price_min, price_max = _PRICE_RANGES[category]
-        price = round(rng.uniform(price_min, price_max), 2)
-        products.append(
-            {
-                "product_identifier": generate_random_product_identifier(rng),
-                "category": category,
-                "price": price,
-            }
-        )
-    return pd.DataFrame(products)
+    # Draw every product's category, price and identifier in bulk instead of per product
+    category_idx = rng.integers(len(_CATEGORIES), size=num_products)
+    price_bounds = _PRICE_BOUNDS[category_idx]
+    prices = np.round(rng.uniform(price_bounds[:, 0], price_bounds[:, 1]), 2)
+
+    return pd.DataFrame(
+        {
+            "product_identifier": generate_random_product_identifiers(rng, num_products),
+            "category": _CATEGORY_ARRAY[category_idx],
+            "price": prices,
+        },
+        copy=False,
+    )
@@ -8,6 +8,8 @@ from typing import Dict
 
 import pandas as pd
 
+from .synthesizer_models import fit_gaussian_copula, require_sdv, sample_synthesizer
+
 
 def simulate_products_synthesizer_based(config: Dict) -> pd.DataFrame:
     """
@@ -15,16 +17,10 @@ def simulate_products_synthesizer_based(config: Dict) -> pd.DataFrame:
     Args:
         config: Complete configuration dictionary
     Returns:
-        DataFrame of synthetic products
+        DataFrame of synthetic products; with PARAMS.num_samples > 1 the draws are stacked
+        and labelled by a leading sample_id column
     """
-    try:
-        from sdv.metadata import SingleTableMetadata
-        from sdv.single_table import GaussianCopulaSynthesizer
-    except ImportError:
-        raise ImportError(
-            "SDV is required for synthesizer-based simulation. "
-            "Install with: pip install online-retail-simulator[synthesizer]"
-        )
+    require_sdv()
 
     params = config["SYNTHESIZER"]["PRODUCTS"]["PARAMS"]
     training_data_path, num_rows, seed = (
@@ -32,22 +28,10 @@ def simulate_products_synthesizer_based(config: Dict) -> pd.DataFrame:
         params["num_rows"],
         params["seed"],
     )
+    num_samples = params.get("num_samples", 1)
 
-    # Load training data
-    training_data = pd.read_csv(training_data_path)
-
-    # Step 1: Create metadata and synthesizer
-    metadata = SingleTableMetadata()
-    metadata.detect_from_dataframe(training_data)
-    synthesizer = GaussianCopulaSynthesizer(metadata)
-
-    # Step 2: Train the synthesizer
-    synthesizer.fit(training_data)
-
-    # Step 3: Generate synthetic data with seed
-    import numpy as np
-
-    np.random.seed(seed)
-    synthetic_data = synthesizer.sample(num_rows=num_rows)
+    # Step 1: Fitted synthesizer, reused while the training file is unchanged
+    synthesizer = fit_gaussian_copula(training_data_path)
 
-    return synthetic_data
+    # Step 2: Generate synthetic data with seed, all Monte Carlo draws in one sample() call
+    return sample_synthesizer(synthesizer, num_rows, seed, num_samples)
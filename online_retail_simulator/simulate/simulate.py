@@ -2,18 +2,18 @@
 Simulate workflow: combines products and metrics simulation.
 """
 
-from typing import Optional
+from typing import Dict, Optional, Union
 
 import pandas as pd
 
 from ..config_processor import process_config
 from ..manage import JobInfo, create_job, save_job_metadata
-from .metrics import simulate_metrics
-from .product_details import simulate_product_details
-from .products import simulate_products
+from .metrics import _simulate_metrics
+from .product_details import _simulate_product_details
+from .products import _simulate_products
 
 
-def simulate(config_path: str, products_df: Optional[pd.DataFrame] = None) -> JobInfo:
+def simulate(config: Union[str, Dict], products_df: Optional[pd.DataFrame] = None) -> JobInfo:
     """
     Runs simulate_products (or uses provided products), optionally simulate_product_details,
     and simulate_metrics.
@@ -22,7 +22,7 @@ def simulate(config_path: str, products_df: Optional[pd.DataFrame] = None) -> Jo
     under the configured storage path.
 
     Args:
-        config_path: Path to configuration file
+        config: Path to configuration file, or an already loaded config dictionary
         products_df: Optional DataFrame of existing products. If provided, skips
                      product generation and uses this DataFrame instead.
                      Expected columns: product_identifier, category, price
@@ -30,19 +30,24 @@ def simulate(config_path: str, products_df: Optional[pd.DataFrame] = None) -> Jo
     Returns:
         JobInfo: Information about the saved job
     """
-    config = process_config(config_path)
+    config_path = config if isinstance(config, str) else None
+    # Processed once here and handed to every step, which then skip merging and validating it
+    processed_config = process_config(config)
 
     if products_df is not None:
         # Use provided products instead of generating new ones
-        job_info = create_job(config, config_path)
+        job_info = create_job(processed_config, config_path)
         job_info.save_df("products", products_df)
-        save_job_metadata(job_info, config, config_path, num_products=len(products_df))
+        save_job_metadata(job_info, processed_config, config_path, num_products=len(products_df))
     else:
         # Generate new products
-        job_info = simulate_products(config_path)
+        job_info, products_df = _simulate_products(processed_config, config_path)
 
-    if "PRODUCT_DETAILS" in config:
-        job_info = simulate_product_details(job_info, config_path)
+    # Products are handed on in memory rather than read back from the job
+    if "PRODUCT_DETAILS" in processed_config:
+        job_info = _simulate_product_details(job_info, processed_config, config_path, products_df=products_df)
+        # The detailed products replaced products.csv, so metrics read them from the job
+        products_df = None
 
-    job_info = simulate_metrics(job_info, config_path)
+    job_info = _simulate_metrics(job_info, processed_config, config_path, products_df=products_df)
     return job_info
@@ -0,0 +1,132 @@
+"""
+Fitted synthesizer models shared by the synthesizer-based backends.
+
+Fitting dominates a synthesizer run, so models trained on an unchanged local CSV are
+kept in memory and reused across simulate calls.
+"""
+
+import functools
+import os
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from ..core import csv_io
+
+
+def require_sdv() -> None:
+    """Raise an ImportError with install instructions if SDV is not installed."""
+    try:
+        import sdv  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "SDV is required for synthesizer-based simulation. "
+            "Install with: pip install online-retail-simulator[synthesizer]"
+        )
+
+
+def fit_gaussian_copula(training_data_path: str):
+    """
+    Return a Gaussian Copula synthesizer fitted on a training CSV.
+
+    Local files are cached by path, modification time and size, so repeated calls on an
+    unchanged file skip reading and fitting. Remote paths (e.g. S3) are fitted every time.
+
+    Args:
+        training_data_path: Path to the CSV file with training data
+
+    Returns:
+        Fitted GaussianCopulaSynthesizer, shared with other callers of the same file
+    """
+    try:
+        stat = os.stat(training_data_path)
+    except OSError:
+        return _fit(training_data_path)
+
+    return _fit_cached(os.path.abspath(training_data_path), stat.st_mtime_ns, stat.st_size)
+
+
+def sample_synthesizer(synthesizer, num_rows: int, seed: Optional[int], num_samples: int = 1) -> pd.DataFrame:
+    """
+    Draw synthetic rows from a fitted synthesizer.
+
+    The model's sampling state is reset on every call and then seeded with seed, so
+    one fitted model serves any number of seeded calls: equal seeds repeat, different
+    seeds differ. With seed None the model samples as a freshly fitted one would.
+
+    Args:
+        synthesizer: Fitted SDV synthesizer, e.g. from fit_gaussian_copula
+        num_rows: Number of rows per sample
+        seed: Random seed, or None
+        num_samples: Number of Monte Carlo draws, all taken in one sample() call
+
+    Returns:
+        DataFrame of synthetic rows; with num_samples > 1 the draws are stacked and
+        labelled by a leading sample_id column
+
+    Raises:
+        ValueError: If a seed is given but the synthesizer cannot be seeded
+    """
+    # Models keep sampling state between calls; reset it so seeded runs repeat
+    if hasattr(synthesizer, "reset_sampling"):
+        synthesizer.reset_sampling()
+
+    # SDV samples from the model's own random state, which reset_sampling() sets to a
+    # fixed seed; seed the model itself so the requested seed reaches the sampler. The
+    # global numpy RNG is not involved, so the caller's random stream is left untouched.
+    # _set_random_state is private SDV API (1.x); fail loudly rather than ignore the seed
+    if seed is not None:
+        if not hasattr(synthesizer, "_set_random_state"):
+            raise ValueError(
+                f"Cannot seed {type(synthesizer).__name__}: seeded sampling requires an SDV 1.x "
+                "synthesizer providing _set_random_state"
+            )
+        synthesizer._set_random_state(seed)
+
+    synthetic_data = synthesizer.sample(num_rows=num_rows * num_samples)
+
+    if num_samples > 1:
+        synthetic_data.insert(0, "sample_id", np.repeat(np.arange(num_samples), num_rows))
+
+    return synthetic_data
+
+
+@functools.lru_cache(maxsize=8)
+def _fit_cached(training_data_path: str, mtime_ns: int, size: int):
+    """Fit a model on a local file, cached by path, modification time and size."""
+    return _fit(training_data_path)
+
+
+def _fit(training_data_path: str):
+    """Read training data, look up or detect its metadata and fit a Gaussian Copula synthesizer."""
+    from sdv.metadata import SingleTableMetadata
+    from sdv.single_table import GaussianCopulaSynthesizer
+
+    training_data = csv_io.read_csv(training_data_path)
+
+    schema = tuple((str(column), str(dtype)) for column, dtype in training_data.dtypes.items())
+    metadata = SingleTableMetadata.load_from_dict(_detect_metadata(training_data_path, schema, training_data))
+    synthesizer = GaussianCopulaSynthesizer(metadata)
+    synthesizer.fit(training_data)
+    return synthesizer
+
+
+_METADATA_CACHE = {}
+
+
+def _detect_metadata(training_data_path: str, schema: tuple, training_data: pd.DataFrame) -> dict:
+    """
+    Detected metadata of a training file, as a dictionary.
+
+    Detection scans every value, so its result is reused while the file keeps the same
+    columns and dtypes, e.g. when new rows are appended and the model is refitted.
+    """
+    key = (os.path.abspath(training_data_path), schema)
+    if key not in _METADATA_CACHE:
+        from sdv.metadata import SingleTableMetadata
+
+        metadata = SingleTableMetadata()
+        metadata.detect_from_dataframe(training_data)
+        _METADATA_CACHE[key] = metadata.to_dict()
+    return _METADATA_CACHE[key]
@@ -1,3 +1,7 @@
+import subprocess
+import sys
+
+
 def has_synthesizer():
     try:
         from sdv.single_table import CTGANSynthesizer, GaussianCopulaSynthesizer, TVAESynthesizer
@@ -5,3 +9,10 @@ def has_synthesizer():
         return True
     except ImportError:
         return False
+
+
+def loaded_by_package_import(module_filter):
+    """Whether importing the package in a fresh interpreter loads any module matching the filter."""
+    code = f"import sys, online_retail_simulator; print(any({module_filter} for name in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return result.stdout.strip() == "True"
@@ -10,6 +10,8 @@ from online_retail_simulator.core.backends import (
     SynthesizerBackend,
 )
 
+from .import_helpers import loaded_by_package_import
+
 
 class TestBackendRegistry:
     """Tests for BackendRegistry."""
@@ -90,3 +92,15 @@ class TestBackendRegistration:
         """SimulationBackend cannot be instantiated directly."""
         with pytest.raises(TypeError):
             SimulationBackend({})
+
+
+class TestBackendImports:
+    """Tests for lazy loading of backend modules."""
+
+    def test_package_import_does_not_load_rule_modules(self):
+        """Rule-based modules are only imported once a rule backend runs."""
+        assert not loaded_by_package_import("name.endswith('_rule_based')")
+
+    def test_package_import_does_not_load_sdv(self):
+        """SDV is only imported once a synthesizer backend runs."""
+        assert not loaded_by_package_import("name.split('.')[0] == 'sdv'")
@@ -0,0 +1,166 @@
+"""Tests for configuration processing."""
+
+import os
+
+import pytest
+import yaml
+
+from online_retail_simulator.config_processor import (
+    deep_merge,
+    load_config,
+    load_defaults,
+    process_config,
+    validate_config,
+)
+
+
+def _write_config(path, num_products):
+    config = {"RULE": {"PRODUCTS": {"PARAMS": {"num_products": num_products}}}}
+    path.write_text(yaml.safe_dump(config))
+
+
+def test_deep_merge_leaves_inputs_unchanged():
+    """Test that deep_merge merges nested dicts without modifying its inputs."""
+    base = {"A": {"x": 1, "y": {"z": 2}}, "B": [1, 2]}
+    override = {"A": {"y": {"z": 3}}, "C": "new"}
+
+    merged = deep_merge(base, override)
+
+    assert merged == {"A": {"x": 1, "y": {"z": 3}}, "B": [1, 2], "C": "new"}
+    assert base == {"A": {"x": 1, "y": {"z": 2}}, "B": [1, 2]}
+    assert override == {"A": {"y": {"z": 3}}, "C": "new"}
+
+
+def test_deep_merge_result_shares_no_nested_dicts():
+    """Test that mutating a merged result leaves both inputs unchanged."""
+    base = {"A": {"x": 1, "y": {"z": 2}}, "B": [1, 2]}
+    override = {"A": {"w": {"v": 1}}, "C": {"d": 1}}
+
+    merged = deep_merge(base, override)
+    merged["A"]["y"]["z"] = 99
+    merged["A"]["w"]["v"] = 99
+    merged["B"].append(3)
+    merged["C"]["d"] = 99
+
+    assert base == {"A": {"x": 1, "y": {"z": 2}}, "B": [1, 2]}
+    assert override == {"A": {"w": {"v": 1}}, "C": {"d": 1}}
+
+
+def test_process_config_merges_defaults(tmp_path):
+    """Test that user values override defaults and missing values are filled in."""
+    config_path = tmp_path / "config.yaml"
+    _write_config(config_path, 7)
+
+    config = process_config(str(config_path))
+
+    assert config["RULE"]["PRODUCTS"]["PARAMS"]["num_products"] == 7
+    assert config["RULE"]["METRICS"]["FUNCTION"] == "simulate_metrics_rule_based"
+    assert "SYNTHESIZER" not in config
+
+
+def test_process_config_leaves_cached_defaults_intact():
+    """Test that processing configs does not modify the shared defaults."""
+    defaults = load_defaults()
+    assert load_defaults() is defaults
+
+    process_config({"RULE": {"PRODUCTS": {"PARAMS": {"num_products": 3}}}})
+
+    assert "SYNTHESIZER" in defaults
+    assert defaults["RULE"]["PRODUCTS"]["PARAMS"]["num_products"] != 3
+
+
+def test_process_config_dict_result_does_not_alias_defaults():
+    """Test that mutating a config built from a dict does not leak into later calls."""
+    user_config = {"RULE": {"PRODUCTS": {"PARAMS": {"num_products": 3}}}}
+    first = process_config(user_config)
+    seed = first["RULE"]["METRICS"]["PARAMS"]["seed"]
+    first["RULE"]["METRICS"]["PARAMS"]["seed"] = 999
+
+    second = process_config(user_config)
+
+    assert second["RULE"]["METRICS"]["PARAMS"]["seed"] == seed
+    assert load_defaults()["RULE"]["METRICS"]["PARAMS"]["seed"] == seed
+
+
+def test_process_config_dict_matches_file(tmp_path):
+    """Test that an in-memory config gives the same result as the equivalent file."""
+    config_path = tmp_path / "config.yaml"
+    _write_config(config_path, 7)
+
+    from_file = process_config(str(config_path))
+    from_dict = process_config(yaml.safe_load(config_path.read_text()))
+
+    assert from_file == from_dict
+
+
+def test_process_config_cache_returns_independent_copies(tmp_path):
+    """Test that mutating a returned config does not leak into later calls."""
+    config_path = tmp_path / "config.yaml"
+    _write_config(config_path, 7)
+
+    first = process_config(str(config_path))
+    first["RULE"]["PRODUCTS"]["PARAMS"]["num_products"] = 999
+
+    second = process_config(str(config_path))
+    assert second["RULE"]["PRODUCTS"]["PARAMS"]["num_products"] == 7
+
+
+def test_process_config_cache_invalidated_on_change(tmp_path):
+    """Test that editing the config file is picked up despite caching."""
+    config_path = tmp_path / "config.yaml"
+    _write_config(config_path, 7)
+    assert process_config(str(config_path))["RULE"]["PRODUCTS"]["PARAMS"]["num_products"] == 7
+
+    _write_config(config_path, 8)
+    stat = os.stat(config_path)
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert process_config(str(config_path))["RULE"]["PRODUCTS"]["PARAMS"]["num_products"] == 8
+
+
+def test_process_config_shared_skips_copy(tmp_path):
+    """Test that shared=True returns the cached config while the default returns copies."""
+    config_path = tmp_path / "config.yaml"
+    _write_config(config_path, 7)
+
+    shared = process_config(str(config_path), shared=True)
+
+    assert process_config(str(config_path), shared=True) is shared
+    assert process_config(str(config_path)) is not shared
+    assert process_config(str(config_path)) == shared
+
+
+def test_load_config_cache_returns_independent_copies(tmp_path):
+    """Test that the cached raw config is not affected by mutating a loaded copy."""
+    config_path = tmp_path / "config.yaml"
+    _write_config(config_path, 7)
+
+    first = load_config(str(config_path))
+    first["RULE"]["PRODUCTS"]["PARAMS"]["num_products"] = 999
+
+    assert load_config(str(config_path))["RULE"]["PRODUCTS"]["PARAMS"]["num_products"] == 7
+    assert process_config(str(config_path))["RULE"]["PRODUCTS"]["PARAMS"]["num_products"] == 7
+
+
+def test_process_config_rejects_unknown_storage_format():
+    """Test that an unsupported STORAGE.FORMAT is rejected."""
+    config = {"STORAGE": {"PATH": "output", "FORMAT": "xlsx"}, "RULE": {}}
+
+    with pytest.raises(ValueError, match="STORAGE.FORMAT"):
+        process_config(config)
+
+
+def test_validate_config_requires_synthesizer_function():
+    """Test that SYNTHESIZER sections must name their function."""
+    config = {"SYNTHESIZER": {"METRICS": {"PARAMS": {"num_rows": 10}}}}
+
+    with pytest.raises(ValueError, match="SYNTHESIZER.METRICS.FUNCTION is required"):
+        validate_config(config)
+
+
+def test_validate_config_rejects_unexpected_params():
+    """Test that unknown parameters of built-in functions are rejected."""
+    config = {"SYNTHESIZER": {"METRICS": {"FUNCTION": "gaussian_copula", "PARAMS": {"typo": 1}}}}
+
+    with pytest.raises(ValueError, match="Unexpected parameters"):
+        validate_config(config)
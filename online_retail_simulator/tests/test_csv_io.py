@@ -0,0 +1,39 @@
+"""Tests for the CSV reading helpers."""
+
+import pandas as pd
+import pytest
+
+from online_retail_simulator.core import csv_io
+
+
+def test_read_csv_matches_pandas_reader(tmp_path, monkeypatch):
+    """Test that the pyarrow and pandas paths parse dates, gaps and quoting the same way."""
+    csv_path = tmp_path / "training.csv"
+    csv_path.write_text('product_id,date,quantity,note\nB1,2024-01-01,1,\nB2,2024-01-02 10:00:00,,"a, b"\n')
+
+    fast = csv_io.read_csv(str(csv_path))
+    monkeypatch.setattr(csv_io, "pyarrow", None)
+    fallback = csv_io.read_csv(str(csv_path))
+
+    pd.testing.assert_frame_equal(fast, pd.read_csv(csv_path))
+    pd.testing.assert_frame_equal(fallback, pd.read_csv(csv_path))
+
+
+@pytest.mark.parametrize(
+    "csv_text",
+    [
+        "product_id,empty\nB1,\nB2,\n",
+        "product_id,note\nB1,None\nB2,x\n",
+        "product_id,big\nB1,99999999999999999999\nB2,1\n",
+    ],
+    ids=["all_empty_column", "none_string_is_missing", "integer_beyond_int64"],
+)
+def test_read_csv_matches_pandas_edge_cases(tmp_path, csv_text):
+    """Test that values and dtypes match pandas where the pyarrow parser would differ on its own."""
+    pytest.importorskip("pyarrow")
+    csv_path = tmp_path / "training.csv"
+    csv_path.write_text(csv_text)
+
+    result = csv_io.read_csv(str(csv_path))
+
+    pd.testing.assert_frame_equal(result, pd.read_csv(csv_path))
@@ -110,6 +110,148 @@ IMPACT:
         os.unlink(config_path)
 
 
+def test_enrich_config_dict():
+    """Test enrichment with an in-memory config dictionary instead of a file."""
+    config = {
+        "IMPACT": {
+            "FUNCTION": "quantity_boost",
+            "PARAMS": {
+                "effect_size": 0.5,
+                "enrichment_fraction": 0.5,
+                "enrichment_start": "2024-01-02",
+                "seed": 42,
+            },
+        }
+    }
+
+    test_config_path = os.path.join(os.path.dirname(__file__), "config_rule.yaml")
+    job_info = simulate(test_config_path)
+    original_metrics = job_info.load_df("metrics")
+
+    enriched_metrics = enrich(config, job_info).load_df("enriched")
+
+    assert len(enriched_metrics) == len(original_metrics)
+    assert "enriched" in enriched_metrics.columns
+    assert enriched_metrics["ordered_units"].sum() >= original_metrics["ordered_units"].sum()
+
+
+def test_enrich_records_function_matches_dataframe_function():
+    """Test that a legacy record-based registration gives the same result as the DataFrame path."""
+    from online_retail_simulator.enrich import clear_enrichment_registry, register_enrichment_function
+    from online_retail_simulator.enrich.enrichment_library import quantity_boost
+
+    params = {"effect_size": 0.5, "enrichment_fraction": 0.5, "enrichment_start": "2024-01-02", "seed": 42}
+
+    test_config_path = os.path.join(os.path.dirname(__file__), "config_rule.yaml")
+    job_info = simulate(test_config_path)
+
+    clear_enrichment_registry()
+    register_enrichment_function("legacy_quantity_boost", quantity_boost, accepts="records")
+    try:
+        frame_result = enrich({"IMPACT": {"FUNCTION": "quantity_boost", "PARAMS": params}}, job_info)
+        records_result = enrich({"IMPACT": {"FUNCTION": "legacy_quantity_boost", "PARAMS": params}}, job_info)
+    finally:
+        clear_enrichment_registry()
+
+    pd.testing.assert_frame_equal(
+        frame_result.load_df("enriched"), records_result.load_df("enriched"), check_dtype=False
+    )
+
+
+def test_assign_enrichment_leaves_products_unchanged():
+    """Test that assign_enrichment flags the requested fraction without modifying its input."""
+    from online_retail_simulator.enrich.enrichment import assign_enrichment
+
+    products = [{"product_id": f"P{i}", "price": 10.0} for i in range(10)]
+
+    enriched_products = assign_enrichment(products, fraction=0.3, seed=42)
+
+    assert sum(p["enriched"] for p in enriched_products) == 3
+    assert all("enriched" not in p for p in products)
+
+
+def test_apply_enrichment_to_metrics_dataframe_matches_records():
+    """Test that a vectorized effect function gives the same result as the per-record loop."""
+    from online_retail_simulator.enrich.enrichment import apply_enrichment_to_metrics, get_enriched_ids
+
+    metrics = [
+        {"product_id": pid, "date": date, "ordered_units": units}
+        for pid, units in [("A", 1), ("B", 2), ("C", 3)]
+        for date in ["2024-01-01", "2024-01-02"]
+    ]
+    enriched_products = [{"product_id": "A", "enriched": True}, {"product_id": "C", "enriched": True}]
+
+    def double_record(record, enrichment_start, **kwargs):
+        if record["date"] >= enrichment_start:
+            record["ordered_units"] *= 2
+        return record
+
+    def double_frame(df, enrichment_start, **kwargs):
+        df.loc[df["date"] >= enrichment_start, "ordered_units"] *= 2
+        return df
+
+    expected = apply_enrichment_to_metrics(metrics, enriched_products, "2024-01-02", double_record)
+    result = apply_enrichment_to_metrics(metrics, enriched_products, "2024-01-02", double_frame, accepts="dataframe")
+
+    assert result == expected
+    assert [r["ordered_units"] for r in result] == [1, 2, 2, 2, 3, 6]
+    assert metrics[1]["ordered_units"] == 1  # Input left unchanged
+
+    enriched_ids = get_enriched_ids(enriched_products)
+    assert enriched_ids == frozenset({"A", "C"})
+    assert apply_enrichment_to_metrics(metrics, enriched_ids, "2024-01-02", double_record) == expected
+
+    frame_result = apply_enrichment_to_metrics(
+        pd.DataFrame(metrics), enriched_products, "2024-01-02", double_frame, accepts="dataframe"
+    )
+    pd.testing.assert_frame_equal(frame_result, pd.DataFrame(expected))
+
+
+def test_apply_enrichment_to_metrics_keeps_dataframe_index():
+    """Test that both effect function styles return a DataFrame under the input's own index."""
+    from online_retail_simulator.enrich.enrichment import apply_enrichment_to_metrics
+
+    metrics = pd.DataFrame(
+        {"product_id": ["A", "B", "C"], "date": ["2024-01-02"] * 3, "ordered_units": [1, 2, 3]},
+        index=[10, 5, 7],
+    )
+
+    def double_record(record, enrichment_start, **kwargs):
+        record["ordered_units"] *= 2
+        return record
+
+    def double_frame(df, enrichment_start, **kwargs):
+        df["ordered_units"] *= 2
+        return df
+
+    by_record = apply_enrichment_to_metrics(metrics, {"A", "C"}, "2024-01-02", double_record)
+    by_frame = apply_enrichment_to_metrics(metrics, {"A", "C"}, "2024-01-02", double_frame, accepts="dataframe")
+    untreated = apply_enrichment_to_metrics(metrics, set(), "2024-01-02", double_record)
+
+    pd.testing.assert_frame_equal(by_record, by_frame)
+    assert by_record.index.tolist() == [10, 5, 7]
+    assert by_record["ordered_units"].tolist() == [2, 2, 6]
+    pd.testing.assert_frame_equal(untreated, metrics)
+
+
+def test_apply_enrichment_to_metrics_frame_columns_do_not_depend_on_rows():
+    """Test that an empty DataFrame goes through the effect function and gets its output columns."""
+    from online_retail_simulator.enrich.enrichment import apply_enrichment_to_metrics
+
+    def flag_frame(df, enrichment_start, **kwargs):
+        df["boosted"] = True
+        return df
+
+    metrics = pd.DataFrame({"product_id": ["A", "B"], "date": ["2024-01-02"] * 2, "ordered_units": [1, 2]})
+
+    full = apply_enrichment_to_metrics(metrics, {"A"}, "2024-01-02", flag_frame, accepts="dataframe")
+    empty = apply_enrichment_to_metrics(metrics.iloc[:0], {"A"}, "2024-01-02", flag_frame, accepts="dataframe")
+
+    assert list(empty.columns) == list(full.columns)
+    assert empty.empty
+    assert apply_enrichment_to_metrics([], {"A"}, "2024-01-02", flag_frame, accepts="dataframe") == []
+
+
 def test_enrich_invalid_config():
     """Test error handling for invalid config."""
     config_content = """
@@ -7,7 +7,7 @@ from online_retail_simulator.enrich import (
     list_enrichment_functions,
     register_enrichment_function,
 )
-from online_retail_simulator.enrich.enrichment_registry import load_effect_function
+from online_retail_simulator.enrich.enrichment_registry import accepts_dataframe, load_effect_function
 
 
 def test_default_enrichment_functions_registered():
@@ -51,6 +51,25 @@ def test_custom_enrichment_function_registration():
     assert "quantity_boost" in functions  # Default should also be there
 
 
+def test_enrichment_function_accepts_flag():
+    """Test that the accepts flag records which functions take DataFrames."""
+    # Clear registry for clean test
+    clear_enrichment_registry()
+
+    def dummy_enrichment(metrics, **kwargs):
+        return metrics
+
+    register_enrichment_function("records_enrichment", dummy_enrichment)
+    register_enrichment_function("frame_enrichment", dummy_enrichment, accepts="dataframe")
+
+    assert not accepts_dataframe("records_enrichment")
+    assert accepts_dataframe("frame_enrichment")
+    assert accepts_dataframe("quantity_boost")  # Built-ins operate on DataFrames
+
+    with pytest.raises(ValueError, match="accepts must be one of"):
+        register_enrichment_function("invalid", dummy_enrichment, accepts="arrow")
+
+
 def test_invalid_enrichment_function_signature():
     """Test that functions with invalid signatures are rejected."""
     # Clear registry for clean test
@@ -5,6 +5,8 @@ Test for the full simulation workflow using config_rule.yaml.
 import os
 
 import pandas as pd
+import pytest
+import yaml
 
 from online_retail_simulator import JobInfo, load_job_results
 from online_retail_simulator.simulate import simulate
@@ -16,6 +18,7 @@ def test_simulate_full_rule():
 
     assert isinstance(job_info, JobInfo)
     assert job_info.job_id.startswith("job-")
+    assert job_info.get_store() is job_info.get_store()
 
     # Load results to verify they exist
     results = load_job_results(job_info)
@@ -25,3 +28,82 @@ def test_simulate_full_rule():
     assert isinstance(results["metrics"], pd.DataFrame)
     assert not results["products"].empty
     assert not results["metrics"].empty
+
+
+def test_simulate_full_rule_config_dict():
+    config_path = os.path.join(os.path.dirname(__file__), "config_rule.yaml")
+    with open(config_path) as f:
+        config = yaml.safe_load(f)
+
+    job_info = simulate(config)
+
+    results = load_job_results(job_info)
+    assert not results["products"].empty
+    assert not results["metrics"].empty
+    assert len(results["products"]) == config["RULE"]["PRODUCTS"]["PARAMS"]["num_products"]
+    assert job_info.get_store().exists("config.yaml")
+
+
+def test_simulate_full_rule_parquet(tmp_path):
+    """Test that jobs can be stored as zstd-compressed Parquet and loaded back."""
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    config_path = os.path.join(os.path.dirname(__file__), "config_rule.yaml")
+    with open(config_path) as f:
+        config = yaml.safe_load(f)
+    config["STORAGE"] = {"PATH": str(tmp_path), "FORMAT": "parquet"}
+
+    job_info = simulate(config)
+
+    assert job_info.get_store().exists("metrics.parquet")
+    assert not job_info.get_store().exists("metrics.csv")
+    metadata = pq.ParquetFile(job_info.get_store().full_path("metrics.parquet")).metadata
+    assert metadata.row_group(0).column(0).compression == "ZSTD"
+    results = load_job_results(job_info)
+    assert len(results["products"]) == config["RULE"]["PRODUCTS"]["PARAMS"]["num_products"]
+    assert not results["metrics"].empty
+
+
+def test_simulate_full_rule_does_not_reread_products(tmp_path, monkeypatch):
+    """Test that generated products are passed to the metrics step without reading them back."""
+    config_path = os.path.join(os.path.dirname(__file__), "config_rule.yaml")
+    with open(config_path) as f:
+        config = yaml.safe_load(f)
+    config["STORAGE"] = {"PATH": str(tmp_path)}
+    loaded = []
+    original_load_df = JobInfo.load_df
+
+    def recording_load_df(self, name):
+        loaded.append(name)
+        return original_load_df(self, name)
+
+    monkeypatch.setattr(JobInfo, "load_df", recording_load_df)
+
+    job_info = simulate(config)
+
+    assert "products" not in loaded
+    assert job_info.load_df("metrics") is not None
+
+
+def test_simulate_full_rule_processes_config_once(tmp_path, monkeypatch):
+    """Test that a config dict is merged and validated once per run, not once per step."""
+    from online_retail_simulator import config_processor
+
+    config_path = os.path.join(os.path.dirname(__file__), "config_rule.yaml")
+    with open(config_path) as f:
+        config = yaml.safe_load(f)
+    config["STORAGE"] = {"PATH": str(tmp_path)}
+    config["PRODUCT_DETAILS"] = {"FUNCTION": "simulate_product_details_mock"}
+    processed = []
+    original_merge_and_validate = config_processor._merge_and_validate
+
+    def recording_merge_and_validate(user_config):
+        processed.append(user_config)
+        return original_merge_and_validate(user_config)
+
+    monkeypatch.setattr(config_processor, "_merge_and_validate", recording_merge_and_validate)
+
+    job_info = simulate(config)
+
+    assert len(processed) == 1
+    assert job_info.load_df("metrics") is not None
@@ -1,8 +1,16 @@
 """Tests for enrichment impact library functions."""
 
+from datetime import date
+
+import numpy as np
 import pandas as pd
 
-from online_retail_simulator.enrich.enrichment_library import probability_boost, quantity_boost
+from online_retail_simulator.enrich.enrichment_library import (
+    _boost_outcomes_loop,
+    _boost_outcomes_numpy,
+    probability_boost,
+    quantity_boost,
+)
 
 
 def create_test_sales():
@@ -145,6 +153,37 @@ class TestQuantityBoost:
         # Potential outcomes should also be identical
         pd.testing.assert_frame_equal(po1, po2)
 
+    def test_quantity_boost_selection_independent_of_record_order(self):
+        """Test that the enriched products do not depend on input record order."""
+        sales = [
+            {
+                "product_id": f"PROD{i:03d}",
+                "date": "2024-11-20",
+                "ordered_units": 1,
+                "price": 100.0,
+                "unit_price": 100.0,
+                "revenue": 100.0,
+            }
+            for i in range(10)
+        ]
+
+        result1, _ = quantity_boost(sales, enrichment_fraction=0.5, enrichment_start="2024-11-15", seed=7)
+        result2, _ = quantity_boost(sales[::-1], enrichment_fraction=0.5, enrichment_start="2024-11-15", seed=7)
+
+        enriched1 = {s["product_id"] for s in result1 if s["enriched"]}
+        enriched2 = {s["product_id"] for s in result2 if s["enriched"]}
+        assert enriched1 == enriched2
+
+    def test_quantity_boost_accepts_date_start(self):
+        """Test that a date object start gives the same result as the equivalent string."""
+        sales = create_test_sales()
+
+        result_str, po_str = quantity_boost(sales, enrichment_start="2024-11-15", seed=42)
+        result_date, po_date = quantity_boost(sales, enrichment_start=date(2024, 11, 15), seed=42)
+
+        assert result_str == result_date
+        pd.testing.assert_frame_equal(po_str, po_date)
+
     def test_quantity_boost_different_seeds(self):
         """Test that different seeds can produce different results."""
         # Create more products to increase chance of different selection
@@ -409,3 +448,23 @@ class TestImpactLibraryEdgeCases:
 
         # Should be either equal (not enriched) or greater (enriched)
         assert total_qty_result >= total_qty_original
+
+
+class TestBoostOutcomesKernel:
+    """Test that the loop kernel (compiled with numba when installed) matches the numpy fallback."""
+
+    def test_loop_matches_numpy(self):
+        rng = np.random.default_rng(0)
+        n = 200
+        ordered_units = rng.integers(0, 6, n).astype(np.float64)
+        unit_price = np.round(rng.uniform(5, 500, n), 2)
+        y0_revenue = np.round(ordered_units * unit_price, 2)
+        days_since_start = rng.integers(-10, 20, n)
+
+        for ramp_days, min_units in [(0, 1), (7, 0)]:
+            args = (ordered_units, unit_price, y0_revenue, days_since_start, 0.37, ramp_days, min_units)
+            loop_units, loop_y1 = _boost_outcomes_loop(*args)
+            numpy_units, numpy_y1 = _boost_outcomes_numpy(*args)
+
+            np.testing.assert_array_equal(loop_units, numpy_units)
+            np.testing.assert_array_equal(loop_y1, numpy_y1)
@@ -0,0 +1,60 @@
+"""Tests for job listing and cleanup."""
+
+import pandas as pd
+import pytest
+
+from online_retail_simulator import JobInfo, cleanup_old_jobs, list_jobs
+
+
+def test_list_jobs_returns_job_directories_newest_first(tmp_path):
+    """Test that only job directories are listed, sorted newest first."""
+    for name in ["job-20240101-000000-aaaa", "job-20240103-000000-cccc", "job-20240102-000000-bbbb", "other"]:
+        (tmp_path / name).mkdir()
+    (tmp_path / "job-20240104-000000-file").write_text("not a directory")
+
+    assert list_jobs(str(tmp_path)) == [
+        "job-20240103-000000-cccc",
+        "job-20240102-000000-bbbb",
+        "job-20240101-000000-aaaa",
+    ]
+    assert list_jobs(str(tmp_path / "missing")) == []
+
+
+def test_cleanup_old_jobs_keeps_most_recent(tmp_path):
+    """Test that cleanup removes all but the most recent jobs."""
+    for day in range(1, 5):
+        (tmp_path / f"job-2024010{day}-000000-abcd").mkdir()
+
+    removed = cleanup_old_jobs(str(tmp_path), keep_count=2)
+
+    assert removed == ["job-20240102-000000-abcd", "job-20240101-000000-abcd"]
+    assert list_jobs(str(tmp_path)) == ["job-20240104-000000-abcd", "job-20240103-000000-abcd"]
+
+
+def test_load_df_matches_pandas_reader(tmp_path):
+    """Test that CSV artifacts load exactly as pandas' default reader would parse them."""
+    pytest.importorskip("pyarrow")
+
+    job_info = JobInfo("job-1", str(tmp_path))
+    (tmp_path / "job-1").mkdir()
+    csv_path = tmp_path / "job-1" / "metrics.csv"
+    csv_path.write_text("product_identifier,date,units,note\nB1,2024-01-01,1,\nB2,2024-01-02,,x\n")
+
+    pd.testing.assert_frame_equal(job_info.load_df("metrics"), pd.read_csv(csv_path))
+
+
+def test_load_df_prefers_job_file_format(tmp_path):
+    """Test that a stale artifact in the other format does not hide the job's own file."""
+    pytest.importorskip("pyarrow")
+
+    (tmp_path / "job-1").mkdir()
+    csv_job = JobInfo("job-1", str(tmp_path), file_format="csv")
+    parquet_job = JobInfo("job-1", str(tmp_path), file_format="parquet")
+    parquet_job.save_df("metrics", pd.DataFrame({"units": [1]}))
+    csv_job.save_df("metrics", pd.DataFrame({"units": [2]}))
+
+    assert csv_job.load_df("metrics")["units"].tolist() == [2]
+    assert parquet_job.load_df("metrics")["units"].tolist() == [1]
+    (tmp_path / "job-1" / "metrics.csv").unlink()
+    assert csv_job.load_df("metrics")["units"].tolist() == [1]
+    assert csv_job.load_df("missing") is None
@@ -0,0 +1,17 @@
+"""Tests for the JSON serialization helpers."""
+
+from datetime import date
+
+from online_retail_simulator.core import json_io
+
+
+def test_round_trip_matches_standard_library(monkeypatch):
+    """Test that the orjson and standard library paths read and write the same documents."""
+    metadata = {"job_id": "job-1", "num_products": 10, "config_path": None, "start": date(2024, 1, 1)}
+
+    fast_text = json_io.dumps(metadata)
+    monkeypatch.setattr(json_io, "orjson", None)
+    std_text = json_io.dumps(metadata)
+
+    expected = {"job_id": "job-1", "num_products": 10, "config_path": None, "start": "2024-01-01"}
+    assert json_io.loads(fast_text) == json_io.loads(std_text) == expected
@@ -1,5 +1,6 @@
 import os
 
+import numpy as np
 import pandas as pd
 
 from online_retail_simulator.simulate import simulate_metrics, simulate_products
@@ -186,3 +187,78 @@ def test_conversion_rate_config():
 
     # Most should convert through funnel (allowing for randomness)
     assert (df["cart_adds"] > 0).sum() / len(df) > 0.5
+
+
+def test_metrics_rule_funnel_constraints():
+    """Test that every row respects the funnel and that inactive rows are all zero."""
+    config_path = os.path.join(os.path.dirname(__file__), "config_rule.yaml")
+    job_info = simulate_products(config_path)
+    products = job_info.load_df("products")
+    job_info = simulate_metrics(job_info, config_path)
+    df = job_info.load_df("metrics")
+
+    assert len(df) == len(products) * df["date"].nunique()
+    assert (df["visits"] <= df["impressions"]).all()
+    assert (df["cart_adds"] <= df["visits"]).all()
+    assert (df["ordered_units"] <= df["cart_adds"]).all()
+
+    inactive = df["impressions"] == 0
+    assert (df.loc[inactive, ["visits", "cart_adds", "ordered_units", "revenue"]] == 0).all().all()
+    pd.testing.assert_series_equal(
+        df["revenue"], (df["price"] * df["ordered_units"]).round(2), check_names=False, check_dtype=False
+    )
+
+
+def test_funnel_metrics_loop_matches_numpy():
+    """Test that the loop kernel (compiled with numba when installed) matches the numpy fallback."""
+    from online_retail_simulator.simulate.metrics_rule_based import _funnel_metrics_loop, _funnel_metrics_numpy
+
+    rng = np.random.default_rng(0)
+    shape = (6, 40)
+    args = (
+        rng.random(shape) < 0.7,
+        rng.choice([10, 25, 50, 100, 200], size=shape),
+        rng.uniform(0.8, 1.2, size=shape),
+        rng.uniform(0.7, 1.3, size=shape),
+        rng.integers(1, 6, size=shape),
+        np.round(rng.uniform(5, 500, shape[1]), 2),
+        0.15,
+        0.25,
+        0.80,
+    )
+
+    for loop_result, numpy_result in zip(_funnel_metrics_loop(*args), _funnel_metrics_numpy(*args)):
+        np.testing.assert_array_equal(loop_result, numpy_result)
+
+
+def test_draw_categorical_matches_generator_choice():
+    """Test that precomputed categorical draws equal rng.choice with probabilities and leave the same stream."""
+    from online_retail_simulator.simulate.metrics_rule_based import _UNIT_CDF, _UNIT_VALUES, _draw_categorical
+
+    weights = np.array([50, 25, 15, 7, 3])
+    expected_rng, rng = np.random.default_rng(7), np.random.default_rng(7)
+
+    expected = expected_rng.choice([1, 2, 3, 4, 5], size=(30, 12), p=weights / weights.sum())
+    np.testing.assert_array_equal(_draw_categorical(rng, _UNIT_VALUES, _UNIT_CDF, (30, 12)), expected)
+    assert rng.random() == expected_rng.random()
+
+
+def test_metrics_rule_drop_zero_sales():
+    """Test that drop_zero_sales keeps exactly the rows with ordered units."""
+    from online_retail_simulator.config_processor import process_config
+    from online_retail_simulator.simulate.metrics_rule_based import simulate_metrics_rule_based
+
+    config_path = os.path.join(os.path.dirname(__file__), "config_rule.yaml")
+    products = simulate_products(config_path).load_df("products")
+    config = process_config(config_path)
+    config["RULE"]["METRICS"]["PARAMS"]["seed"] = 7
+
+    for granularity in ["daily", "weekly"]:
+        config["RULE"]["METRICS"]["PARAMS"]["granularity"] = granularity
+        config["RULE"]["METRICS"]["PARAMS"]["drop_zero_sales"] = False
+        full = simulate_metrics_rule_based(products, config)
+        config["RULE"]["METRICS"]["PARAMS"]["drop_zero_sales"] = True
+        sparse = simulate_metrics_rule_based(products, config)
+
+        expected = full[full["ordered_units"] > 0].reset_index(drop=True)
+        pd.testing.assert_frame_equal(sparse, expected)
@@ -7,7 +7,10 @@ from online_retail_simulator.simulate import simulate_metrics, simulate_products
 
 from .import_helpers import has_synthesizer
 
-pytestmark = pytest.mark.skipif(not has_synthesizer(), reason="SDV dependencies not installed")
+pytestmark = [
+    pytest.mark.synthesizer,
+    pytest.mark.skipif(not has_synthesizer(), reason="SDV dependencies not installed"),
+]
 
 
 def test_metrics_synthesizer():
@@ -22,3 +25,45 @@ def test_metrics_synthesizer():
     assert "date" in df.columns
     assert "quantity" in df.columns
     assert "revenue" in df.columns
+
+
+def test_metrics_synthesizer_fits_once_per_training_file(monkeypatch):
+    from online_retail_simulator.simulate import synthesizer_models
+    from online_retail_simulator.simulate.metrics_synthesizer_based import simulate_metrics_synthesizer_based
+
+    fitted = []
+    original_fit = synthesizer_models._fit
+
+    def recording_fit(path):
+        fitted.append(path)
+        return original_fit(path)
+
+    monkeypatch.setattr(synthesizer_models, "_fit", recording_fit)
+    synthesizer_models._fit_cached.cache_clear()
+    training_data_path = os.path.join(os.path.dirname(__file__), "df_sales.csv")
+
+    for num_rows in (5, 12):
+        config = {
+            "SYNTHESIZER": {
+                "METRICS": {"PARAMS": {"training_data_path": training_data_path, "num_rows": num_rows, "seed": 1}}
+            }
+        }
+        assert len(simulate_metrics_synthesizer_based(None, config)) == num_rows
+
+    assert len(fitted) == 1
+    synthesizer_models._fit_cached.cache_clear()
+
+
+def test_sample_metrics_synthesizer_seeds_differ_and_repeat():
+    from online_retail_simulator.simulate import fit_metrics_synthesizer, sample_metrics_synthesizer
+
+    training_data_path = os.path.join(os.path.dirname(__file__), "df_sales.csv")
+    config = {"SYNTHESIZER": {"METRICS": {"PARAMS": {"training_data_path": training_data_path}}}}
+    synthesizer = fit_metrics_synthesizer(config)
+
+    first = sample_metrics_synthesizer(synthesizer, num_rows=20, seed=1)
+    repeated = sample_metrics_synthesizer(synthesizer, num_rows=20, seed=1)
+    other = sample_metrics_synthesizer(synthesizer, num_rows=20, seed=2)
+
+    pd.testing.assert_frame_equal(first, repeated)
+    assert not first.equals(other)
@@ -6,6 +6,8 @@ import pytest
 from conftest import OLLAMA_AVAILABLE
 from online_retail_simulator.simulate.product_details_mock import simulate_product_details_mock
 
+from .import_helpers import loaded_by_package_import
+
 
 @pytest.fixture
 def sample_products():
@@ -76,3 +78,50 @@ class TestProductDetailsOllama:
         assert "brand" in result.columns
         assert "features" in result.columns
         assert len(result) == len(sample_products)
+
+
+class TestProductDetailsOllamaBatching:
+    """Tests for concurrent Ollama batching, with the HTTP call replaced by a local fake."""
+
+    def test_batches_keep_input_order(self, monkeypatch):
+        """Results should follow the input order even when later batches finish first."""
+        import json
+        import time
+
+        import requests
+
+        from online_retail_simulator.simulate.product_details_ollama import simulate_product_details_ollama
+
+        class FakeResponse:
+            def __init__(self, payload):
+                self._payload = payload
+
+            def raise_for_status(self):
+                pass
+
+            def json(self):
+                return {"response": json.dumps(self._payload)}
+
+        def fake_post(self, url, **kwargs):
+            prompt = kwargs["json"]["prompt"]
+            batch = json.loads(prompt.split("Products:\n", 1)[1].split("\n\nFor each", 1)[0])
+            # Later batches answer faster, so completion order differs from submission order
+            time.sleep(0.01 * (5 - int(batch[0]["product_identifier"][1:]) // 5))
+            return FakeResponse(
+                [{**p, "title": "t", "description": "d", "brand": "b", "features": ["f"]} for p in batch]
+            )
+
+        monkeypatch.setattr(requests.Session, "post", fake_post)
+        products = pd.DataFrame(
+            {"product_identifier": [f"P{i:02d}" for i in range(23)], "category": "Electronics", "price": 1.0}
+        )
+
+        result = simulate_product_details_ollama(products, max_workers=4)
+
+        assert result["product_identifier"].tolist() == products["product_identifier"].tolist()
+        assert "quality_score" in result.columns
+
+
+def test_package_import_does_not_load_ollama_client():
+    """The Ollama backend and its HTTP client are imported only when that backend is used."""
+    assert not loaded_by_package_import("name == 'requests'")
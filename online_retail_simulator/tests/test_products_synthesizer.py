@@ -8,7 +8,10 @@ from online_retail_simulator.simulate import simulate_products
 
 from .import_helpers import has_synthesizer
 
-pytestmark = pytest.mark.skipif(not has_synthesizer(), reason="SDV dependencies not installed")
+pytestmark = [
+    pytest.mark.synthesizer,
+    pytest.mark.skipif(not has_synthesizer(), reason="SDV dependencies not installed"),
+]
 
 
 def test_products_synthesizer():
@@ -23,3 +26,21 @@ def test_products_synthesizer():
     assert "product_id" in df.columns
     assert "price" in df.columns
     assert "category" in df.columns
+
+
+def test_products_synthesizer_num_samples():
+    from online_retail_simulator.simulate.products_synthesizer_based import simulate_products_synthesizer_based
+
+    training_data_path = os.path.join(os.path.dirname(__file__), "df_start.csv")
+    config = {
+        "SYNTHESIZER": {
+            "PRODUCTS": {
+                "PARAMS": {"training_data_path": training_data_path, "num_rows": 5, "seed": 42, "num_samples": 3}
+            }
+        }
+    }
+
+    df = simulate_products_synthesizer_based(config)
+
+    assert len(df) == 15
+    assert df["sample_id"].tolist() == [0] * 5 + [1] * 5 + [2] * 5
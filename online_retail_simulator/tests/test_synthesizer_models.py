@@ -0,0 +1,90 @@
+"""Tests for the fitted synthesizer cache and sampling helper."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from online_retail_simulator.simulate import synthesizer_models
+
+
+def test_fit_gaussian_copula_reuses_model_until_file_changes(tmp_path, monkeypatch):
+    """Test that an unchanged training file is fitted once and a modified one is refitted."""
+    fitted = []
+
+    def fake_fit(path):
+        fitted.append(path)
+        return object()
+
+    monkeypatch.setattr(synthesizer_models, "_fit", fake_fit)
+    synthesizer_models._fit_cached.cache_clear()
+    training_data = tmp_path / "train.csv"
+    training_data.write_text("a,b\n1,2\n")
+
+    first = synthesizer_models.fit_gaussian_copula(str(training_data))
+    second = synthesizer_models.fit_gaussian_copula(str(training_data))
+    training_data.write_text("a,b\n1,2\n3,4\n")
+    third = synthesizer_models.fit_gaussian_copula(str(training_data))
+
+    assert first is second
+    assert third is not first
+    assert len(fitted) == 2
+    synthesizer_models._fit_cached.cache_clear()
+
+
+class FakeSynthesizer:
+    """Samples like an SDV synthesizer: from its own random state, fixed by reset_sampling()."""
+
+    FIXED_RNG_SEED = 73251
+
+    def __init__(self):
+        self._set_random_state(self.FIXED_RNG_SEED)
+
+    def _set_random_state(self, random_state):
+        self._random_state = np.random.RandomState(random_state)
+
+    def reset_sampling(self):
+        self._set_random_state(self.FIXED_RNG_SEED)
+
+    def sample(self, num_rows):
+        return pd.DataFrame({"value": self._random_state.random_sample(num_rows)})
+
+
+def test_sample_synthesizer_is_repeatable_and_labels_samples():
+    """Test that seeded samples repeat on one fitted model and leave the global RNG untouched."""
+    synthesizer = FakeSynthesizer()
+    np.random.seed(0)
+    expected_next = np.random.random()
+    np.random.seed(0)
+
+    first = synthesizer_models.sample_synthesizer(synthesizer, 4, seed=7, num_samples=3)
+    second = synthesizer_models.sample_synthesizer(synthesizer, 4, seed=7, num_samples=3)
+
+    pd.testing.assert_frame_equal(first, second)
+    assert first["sample_id"].tolist() == [0] * 4 + [1] * 4 + [2] * 4
+    assert np.random.random() == expected_next
+
+
+def test_sample_synthesizer_seeds_reach_the_model():
+    """Test that different seeds give different samples from one fitted model."""
+    synthesizer = FakeSynthesizer()
+
+    samples = [synthesizer_models.sample_synthesizer(synthesizer, 4, seed=seed) for seed in range(3)]
+    unseeded = synthesizer_models.sample_synthesizer(synthesizer, 4, seed=None)
+
+    assert not samples[0].equals(samples[1])
+    assert not samples[1].equals(samples[2])
+    pd.testing.assert_frame_equal(unseeded, FakeSynthesizer().sample(4))
+
+
+def test_sample_synthesizer_rejects_seed_it_cannot_apply():
+    """Test that a seed is never silently ignored by a synthesizer without a settable random state."""
+
+    class UnseedableSynthesizer:
+        def sample(self, num_rows):
+            return pd.DataFrame({"value": np.zeros(num_rows)})
+
+    synthesizer = UnseedableSynthesizer()
+
+    assert len(synthesizer_models.sample_synthesizer(synthesizer, 3, seed=None)) == 3
+    with pytest.raises(ValueError, match="Cannot seed UnseedableSynthesizer"):
+        synthesizer_models.sample_synthesizer(synthesizer, 3, seed=1)